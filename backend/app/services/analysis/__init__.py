@@ -8,12 +8,14 @@ and smart analysis orchestration.
 from .article_type_detector import (
     ArticleTypeDetector,
     DetectedArticleType,
+    get_article_type_detector,
     detect_article_type,
     ARTICLE_TYPE_PATTERNS,
 )
 
 from .topic_validator import (
     TopicRelevanceValidator,
+    PreparedValidation,
     validate_topics,
 )
 
@@ -23,6 +25,7 @@ from .dynamic_stats import (
     SubfieldStats,
     get_stats_calculator,
     get_subfield_stats,
+    clear_stats_cache,
     calculate_percentile_score,
 )
 
@@ -56,16 +59,19 @@ __all__ = [
     # Article type detection
     "ArticleTypeDetector",
     "DetectedArticleType",
+    "get_article_type_detector",
     "detect_article_type",
     "ARTICLE_TYPE_PATTERNS",
     # Topic validation
     "TopicRelevanceValidator",
+    "PreparedValidation",
     "validate_topics",
     # Dynamic Statistics
     "DynamicStatsCalculator",
     "SubfieldStats",
     "get_stats_calculator",
     "get_subfield_stats",
+    "clear_stats_cache",
     "calculate_percentile_score",
     # Smart Analyzer (Phase 2)
     "SmartAnalyzer",
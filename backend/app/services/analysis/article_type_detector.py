@@ -6,7 +6,7 @@ Supports: systematic review, meta-analysis, RCT, cohort study, case-control,
 cross-sectional, case report, narrative review, original research.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Pattern, Tuple
 from dataclasses import dataclass
 import re
 
@@ -277,34 +277,32 @@ JOURNAL_TYPE_EXAMPLES: Dict[str, List[str]] = {
 }
 
 
-class ArticleTypeDetector:
-    """Detects academic article type from text."""
-
-    def detect(self, abstract: str, title: str = "") -> DetectedArticleType:
-        """
-        Detect the article type from abstract and title.
+# Patterns compiled once at import: (type_id, config, [(pattern, compiled)])
+_COMPILED_ARTICLE_TYPE_PATTERNS: List[Tuple[str, Dict, List[Tuple[str, Pattern]]]] = [
+    (
+        type_id,
+        config,
+        [(pattern, re.compile(pattern, re.IGNORECASE)) for pattern in config["patterns"]],
+    )
+    for type_id, config in ARTICLE_TYPE_PATTERNS.items()
+]
 
-        Args:
-            abstract: Article abstract text.
-            title: Optional article title.
 
-        Returns:
-            The most likely article type with confidence score.
-        """
-        text = f"{title} {abstract}".lower()
+class ArticleTypeDetector:
+    """Detects academic article type from text (stateless, safe to share)."""
 
+    def _match_types(self, text: str) -> List[DetectedArticleType]:
+        """Return every article type whose patterns match, sorted by confidence."""
         matches: List[DetectedArticleType] = []
 
-        for type_id, config in ARTICLE_TYPE_PATTERNS.items():
-            evidence: List[str] = []
-
-            for pattern in config["patterns"]:
-                if re.search(pattern, text, re.IGNORECASE):
-                    evidence.append(pattern)
+        for type_id, config, compiled_patterns in _COMPILED_ARTICLE_TYPE_PATTERNS:
+            evidence: List[str] = [
+                pattern for pattern, regex in compiled_patterns if regex.search(text)
+            ]
 
             if len(evidence) >= config["required_count"]:
                 # Calculate confidence based on pattern matches
-                confidence = min(len(evidence) / len(config["patterns"]) * 2, 1.0)
+                confidence = min(len(evidence) / len(compiled_patterns) * 2, 1.0)
                 matches.append(DetectedArticleType(
                     type_id=type_id,
                     display_name=config["display_name"],
@@ -315,6 +313,20 @@ class ArticleTypeDetector:
 
         # Sort by confidence descending
         matches.sort(key=lambda x: x.confidence, reverse=True)
+        return matches
+
+    def detect(self, abstract: str, title: str = "") -> DetectedArticleType:
+        """
+        Detect the article type from abstract and title.
+
+        Args:
+            abstract: Article abstract text.
+            title: Optional article title.
+
+        Returns:
+            The most likely article type with confidence score.
+        """
+        matches = self._match_types(f"{title} {abstract}".lower())
 
         # Handle combined types (e.g., Systematic Review AND Meta-Analysis)
         if matches:
@@ -366,29 +378,7 @@ class ArticleTypeDetector:
         Returns:
             List of all matching article types, sorted by confidence.
         """
-        text = f"{title} {abstract}".lower()
-
-        matches: List[DetectedArticleType] = []
-
-        for type_id, config in ARTICLE_TYPE_PATTERNS.items():
-            evidence: List[str] = []
-
-            for pattern in config["patterns"]:
-                if re.search(pattern, text, re.IGNORECASE):
-                    evidence.append(pattern)
-
-            if len(evidence) >= config["required_count"]:
-                confidence = min(len(evidence) / len(config["patterns"]) * 2, 1.0)
-                matches.append(DetectedArticleType(
-                    type_id=type_id,
-                    display_name=config["display_name"],
-                    confidence=confidence,
-                    evidence=evidence,
-                    preferred_journal_types=config["preferred_journals"],
-                ))
-
-        matches.sort(key=lambda x: x.confidence, reverse=True)
-        return matches
+        return self._match_types(f"{title} {abstract}".lower())
 
     def to_dict(self, article_type: DetectedArticleType) -> Dict:
         """
@@ -409,6 +399,18 @@ class ArticleTypeDetector:
         }
 
 
+# Global detector instance (stateless, shared across requests)
+_article_type_detector: Optional[ArticleTypeDetector] = None
+
+
+def get_article_type_detector() -> ArticleTypeDetector:
+    """Get or create the global article type detector."""
+    global _article_type_detector
+    if _article_type_detector is None:
+        _article_type_detector = ArticleTypeDetector()
+    return _article_type_detector
+
+
 # Convenience function for quick detection
 def detect_article_type(abstract: str, title: str = "") -> DetectedArticleType:
     """
@@ -421,5 +423,4 @@ def detect_article_type(abstract: str, title: str = "") -> DetectedArticleType:
     Returns:
         The detected article type.
     """
-    detector = ArticleTypeDetector()
-    return detector.detect(abstract, title)
+    return get_article_type_detector().detect(abstract, title)
@@ -18,7 +18,7 @@ from statistics import median, quantiles
 import time
 import logging
 
-from app.services.openalex.client import get_client
+from app.services.openalex.client import SOURCE_BATCH_SIZE, get_client
 
 logger = logging.getLogger(__name__)
 
@@ -172,18 +172,23 @@ class DynamicStatsCalculator:
                 per_page=max_journals,
             )
 
-            # Get full journal details for each source
+            source_ids = [
+                entry.get("key") for entry in results[:max_journals] if entry.get("key")
+            ]
+
+            # Get full journal details in batched lookups, in ranking order
             journals = []
-            for entry in results[:max_journals]:
-                source_id = entry.get("key")
-                if source_id:
-                    source = client.get_source_by_id(source_id)
+            for start in range(0, len(source_ids), SOURCE_BATCH_SIZE):
+                batch = source_ids[start:start + SOURCE_BATCH_SIZE]
+                sources = client.get_sources_by_ids(batch)
+                for source_id in batch:
+                    source = sources.get(source_id)
                     if source:
                         journals.append(source)
 
-                # Limit API calls
-                if len(journals) >= 50:
-                    break
+                    # Limit API calls
+                    if len(journals) >= 50:
+                        return journals
 
             return journals
         except Exception as e:
@@ -250,6 +255,11 @@ def get_subfield_stats(subfield_id: int, name: str = "") -> SubfieldStats:
     return calculator.get_subfield_stats(subfield_id, name)
 
 
+def clear_stats_cache() -> None:
+    """Clear the global calculator's statistics cache."""
+    get_stats_calculator().clear_cache()
+
+
 def calculate_percentile_score(
     value: float,
     median_val: float,
@@ -8,6 +8,7 @@ Phase 3: Now includes Gemini LLM integration for complex cases.
 """
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 
@@ -154,9 +155,15 @@ class SmartAnalyzer:
         user_kw = user_keywords or []
         result.search_terms = extract_search_terms(combined_text, user_kw)
 
-        # Step 2: OpenAlex Topics analysis
+        # Step 2: OpenAlex Topics analysis. The keyword extraction (step 3)
+        # needs its own works request - run it alongside the topics request
         search_query = " ".join(result.search_terms[:8])
-        topics_result = self.topics_service.analyze_topics_from_query(search_query)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            keywords_future = executor.submit(
+                self.keywords_extractor.extract_from_works, search_query, max_works=30
+            )
+            topics_result = self.topics_service.analyze_topics_from_query(search_query)
+            ranked_keywords = keywords_future.result()
 
         result.disciplines = topics_result.all_subfields
         result.topic_ids = topics_result.topic_ids
@@ -170,10 +177,7 @@ class SmartAnalyzer:
             result.primary_field = primary.field_name
             result.discipline_confidence = primary.confidence
 
-        # Step 3: Keywords extraction
-        ranked_keywords = self.keywords_extractor.extract_from_works(
-            search_query, max_works=30
-        )
+        # Step 3: Keywords extraction (works fetched concurrently above)
         if user_kw:
             ranked_keywords = self.keywords_extractor.merge_with_user_keywords(
                 ranked_keywords, user_kw
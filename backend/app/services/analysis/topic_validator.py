@@ -5,9 +5,22 @@ Validates that journal topics are actually relevant to the search.
 Filters out journals that appear in results but have irrelevant topics.
 """
 
+from dataclasses import dataclass
 from typing import List, Dict, Set, Optional
 
 
+@dataclass
+class PreparedValidation:
+    """
+    Search-side inputs shared by every journal validated for one search.
+
+    Built once by TopicRelevanceValidator.prepare().
+    """
+    expected_keywords: Set[str]
+    # Unrelated-topic patterns that apply to the detected disciplines
+    irrelevant_patterns: List[str]
+
+
 class TopicRelevanceValidator:
     """Validates topic relevance for search results."""
 
@@ -43,11 +56,52 @@ class TopicRelevanceValidator:
         "neonatal": ["geriatrics"],
     }
 
+    def prepare(
+        self,
+        detected_disciplines: List[Dict],
+        keywords: List[str],
+    ) -> PreparedValidation:
+        """
+        Precompute the search-side lookups used for every journal.
+
+        Args:
+            detected_disciplines: List of detected disciplines.
+            keywords: Search keywords.
+
+        Returns:
+            PreparedValidation to reuse across all journals of a search.
+        """
+        # Build expected keyword set
+        expected_keywords: Set[str] = set()
+        discipline_names: Set[str] = set()
+
+        for disc in detected_disciplines:
+            evidence = disc.get("evidence", [])
+            expected_keywords.update(e.lower() for e in evidence)
+            disc_name = disc.get("name", "")
+            if disc_name:
+                discipline_names.add(disc_name.lower())
+
+        expected_keywords.update(kw.lower() for kw in keywords)
+
+        # Keep only patterns whose excluded list hits a detected discipline
+        irrelevant_patterns = [
+            pattern
+            for pattern, excluded_disciplines in self.UNRELATED_TOPIC_PATTERNS.items()
+            if any(disc in excluded_disciplines for disc in discipline_names)
+        ]
+
+        return PreparedValidation(
+            expected_keywords=expected_keywords,
+            irrelevant_patterns=irrelevant_patterns,
+        )
+
     def validate_journal_topics(
         self,
         journal: Dict,
         detected_disciplines: List[Dict],
         keywords: List[str],
+        prepared: Optional[PreparedValidation] = None,
     ) -> Dict:
         """
         Validate that a journal's topics are relevant.
@@ -56,6 +110,8 @@ class TopicRelevanceValidator:
             journal: Journal data with topics.
             detected_disciplines: List of detected disciplines.
             keywords: Search keywords.
+            prepared: Result of prepare() for the same disciplines and keywords
+                (built if omitted).
 
         Returns:
             {
@@ -76,18 +132,10 @@ class TopicRelevanceValidator:
         else:
             topic_names = []
 
-        # Build expected keyword set
-        expected_keywords: Set[str] = set()
-        discipline_names: Set[str] = set()
-
-        for disc in detected_disciplines:
-            evidence = disc.get("evidence", [])
-            expected_keywords.update(e.lower() for e in evidence)
-            disc_name = disc.get("name", "")
-            if disc_name:
-                discipline_names.add(disc_name.lower())
-
-        expected_keywords.update(kw.lower() for kw in keywords)
+        if prepared is None:
+            prepared = self.prepare(detected_disciplines, keywords)
+        expected_keywords = prepared.expected_keywords
+        irrelevant_patterns = prepared.irrelevant_patterns
 
         relevant_topics: List[str] = []
         irrelevant_topics: List[str] = []
@@ -106,14 +154,12 @@ class TopicRelevanceValidator:
                     is_relevant = True
                     break
 
-            # Check for known unrelated patterns
+            # Check for known unrelated patterns (pre-filtered to detected disciplines)
             if not is_relevant:
-                for pattern, excluded_disciplines in self.UNRELATED_TOPIC_PATTERNS.items():
+                for pattern in irrelevant_patterns:
                     if pattern in topic:
-                        # Check if any detected discipline is in the excluded list
-                        if any(disc in excluded_disciplines for disc in discipline_names):
-                            is_irrelevant = True
-                            break
+                        is_irrelevant = True
+                        break
 
             if is_relevant:
                 relevant_topics.append(topic)
@@ -170,12 +216,14 @@ class TopicRelevanceValidator:
             Filtered list of journals with topic_validation added.
         """
         filtered: List[Dict] = []
+        prepared = self.prepare(detected_disciplines, keywords)
 
         for journal in journals:
             validation = self.validate_journal_topics(
                 journal,
                 detected_disciplines,
-                keywords
+                keywords,
+                prepared,
             )
 
             # Include if relevant and meets minimum score
@@ -204,11 +252,13 @@ class TopicRelevanceValidator:
         Returns:
             Journals with topic_validation field added.
         """
+        prepared = self.prepare(detected_disciplines, keywords)
         for journal in journals:
             validation = self.validate_journal_topics(
                 journal,
                 detected_disciplines,
-                keywords
+                keywords,
+                prepared,
             )
             journal["topic_validation"] = validation
 
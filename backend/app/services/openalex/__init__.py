@@ -122,7 +122,7 @@ from .constants import (
 )
 
 # Service class and global instance (backward compat)
-from .service import OpenAlexService, openalex_service
+from .service import OpenAlexService, get_openalex_service
 
 
 __all__ = [
@@ -185,5 +185,13 @@ __all__ = [
     "load_core_journals",
     # Service (backward compat)
     "OpenAlexService",
+    "get_openalex_service",
     "openalex_service",
 ]
+
+
+def __getattr__(name: str):
+    # openalex_service is created lazily on first access (PEP 562)
+    if name == "openalex_service":
+        return get_openalex_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,8 +10,10 @@ Async methods (search_works_async, get_sources_async) use httpx directly
 for Universal Mode operations.
 """
 import pyalex
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Hashable, Tuple
 import logging
+import threading
+import time
 
 from .config import get_config
 
@@ -20,16 +22,87 @@ logger = logging.getLogger(__name__)
 # OpenAlex API base URL for async operations
 OPENALEX_API_BASE = "https://api.openalex.org"
 
+# Max ids per OR filter (OpenAlex allows up to 100 values per filter)
+SOURCE_BATCH_SIZE = 50
+
+# Source fields read by convert_to_journal and the stats/merge helpers
+SOURCE_SELECT_FIELDS = [
+    "id", "display_name", "issn", "issn_l", "host_organization_name",
+    "homepage_url", "type", "is_oa", "is_in_doaj", "apc_usd",
+    "works_count", "cited_by_count", "summary_stats", "topics", "x_concepts",
+]
+
+# Work fields read by the topics, keywords and concepts analyzers. They share
+# one list so their identical queries still share a cached response.
+ANALYSIS_WORK_SELECT_FIELDS = ["topics", "keywords", "concepts"]
+
 
 class OpenAlexClient:
     """
     Client for OpenAlex API operations.
 
-    Wraps pyalex with consistent error handling.
+    Wraps pyalex with consistent error handling. Successful sync lookups
+    are kept in a short in-memory TTL cache (see clear_cache()).
+
+    The client is a process-wide singleton, so its request semaphore is a
+    global rate limit: all concurrent searches on the server share the
+    MAX_INFLIGHT_REQUESTS slots, not just the threads of one search.
     """
 
-    def __init__(self):
+    # Response cache for the sync lookups (similar abstracts repeat queries)
+    CACHE_TTL_SECONDS: int = 3600
+    CACHE_MAX_ENTRIES: int = 2048
+
+    def __init__(self, cache_enabled: bool = True):
         self.config = get_config()
+        self.cache_enabled = cache_enabled
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+        # Global rate limit: caps in-flight requests for the whole process,
+        # across every concurrent search (OpenAlex limit ~10 req/s)
+        self._request_slots = threading.BoundedSemaphore(
+            self.config.MAX_INFLIGHT_REQUESTS
+        )
+        # Failed requests so far; callers compare snapshots to spot degraded results
+        self._failure_count = 0
+
+    def _cache_get(self, key: Hashable) -> Optional[Any]:
+        """Return a cached response, or None if missing/expired."""
+        if not self.cache_enabled:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= self.CACHE_TTL_SECONDS:
+                del self._cache[key]
+                return None
+            return entry[1]
+
+    def _cache_set(self, key: Hashable, value: Any) -> None:
+        """Cache a successful response, evicting the oldest when full."""
+        if not self.cache_enabled:
+            return
+        with self._cache_lock:
+            self._cache.pop(key, None)
+            if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = (time.time(), value)
+
+    def clear_cache(self) -> None:
+        """Clear all cached responses."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    @property
+    def failure_count(self) -> int:
+        """Number of OpenAlex requests that have failed in this process."""
+        return self._failure_count
+
+    def record_failure(self) -> None:
+        """Count a failed OpenAlex request (errors are logged, not raised)."""
+        with self._cache_lock:
+            self._failure_count += 1
 
     def search_sources(self, query: str, per_page: int = 25) -> List[dict]:
         """
@@ -42,10 +115,21 @@ class OpenAlexClient:
         Returns:
             List of source dictionaries.
         """
+        key = ("search_sources", query, per_page)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
-            return pyalex.Sources().search(query).get(per_page=per_page)
+            # Full records on purpose: hits go straight into convert_to_journal
+            # and callers may hand them on as full source details
+            with self._request_slots:
+                sources = pyalex.Sources().search(query).get(per_page=per_page)
+            self._cache_set(key, sources)
+            return sources
         except Exception as e:
             logger.error(f"Error searching sources directly: {e}")
+            self.record_failure()
             return []
 
     def search_works(
@@ -54,6 +138,7 @@ class OpenAlexClient:
         per_page: int = 200,
         page: int = 1,
         from_date: str = "2019-01-01",
+        select: Optional[List[str]] = None,
     ) -> List[dict]:
         """
         Search for works (papers) on a topic.
@@ -63,19 +148,31 @@ class OpenAlexClient:
             per_page: Number of results per page.
             page: Page number.
             from_date: Filter works from this date.
+            select: Top-level fields to return (reduces payload). All fields if None.
 
         Returns:
             List of work dictionaries.
         """
+        key = ("search_works", query, per_page, page, from_date, tuple(select or ()))
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
-            return (
+            works_query = (
                 pyalex.Works()
                 .search(query)
                 .filter(type="article", from_publication_date=from_date)
-                .get(per_page=per_page, page=page)
             )
+            if select:
+                works_query = works_query.select(select)
+            with self._request_slots:
+                works = works_query.get(per_page=per_page, page=page)
+            self._cache_set(key, works)
+            return works
         except Exception as e:
             logger.error(f"Error searching works: {e}")
+            self.record_failure()
             return []
 
     def get_source_by_id(self, source_id: str) -> Optional[dict]:
@@ -88,14 +185,81 @@ class OpenAlexClient:
         Returns:
             Source dictionary or None on error.
         """
+        if not source_id:
+            return None
+        if source_id.startswith("https://"):
+            source_id = source_id.split("/")[-1]
+
+        key = ("get_source_by_id", source_id)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
-            if source_id.startswith("https://"):
-                source_id = source_id.split("/")[-1]
-            return pyalex.Sources()[source_id]
+            with self._request_slots:
+                source = pyalex.Sources()[source_id]
+            self._cache_set(key, source)
+            return source
         except Exception as e:
             logger.error(f"Error fetching source {source_id}: {e}")
+            self.record_failure()
             return None
 
+    def get_sources_by_ids(self, source_ids: List[str]) -> Dict[str, dict]:
+        """
+        Get many sources/journals in batched requests.
+
+        Uses an OR filter on openalex_id, so N lookups cost one request
+        per SOURCE_BATCH_SIZE ids instead of N requests. Only
+        SOURCE_SELECT_FIELDS are requested; these partial records are
+        cached apart from get_source_by_id(), which keeps full records.
+
+        Args:
+            source_ids: OpenAlex source IDs or URLs.
+
+        Returns:
+            Dict of full source URL -> source dictionary. Missing or failed
+            ids are simply absent.
+        """
+        short_ids = list(dict.fromkeys(
+            sid.split("/")[-1] if sid.startswith("https://") else sid
+            for sid in source_ids if sid
+        ))
+        sources: Dict[str, dict] = {}
+
+        # Serve what we can from the per-source cache
+        uncached_ids = []
+        for short_id in short_ids:
+            cached = self._cache_get(("get_sources_by_ids", short_id))
+            if cached is not None:
+                sources[cached.get("id") or short_id] = cached
+            else:
+                uncached_ids.append(short_id)
+        short_ids = uncached_ids
+
+        for start in range(0, len(short_ids), SOURCE_BATCH_SIZE):
+            batch = short_ids[start:start + SOURCE_BATCH_SIZE]
+            try:
+                with self._request_slots:
+                    results = (
+                        pyalex.Sources()
+                        .filter(openalex_id="|".join(batch))
+                        .select(SOURCE_SELECT_FIELDS)
+                        .get(per_page=len(batch))
+                    )
+            except Exception as e:
+                logger.error(f"Error fetching {len(batch)} sources: {e}")
+                self.record_failure()
+                continue
+
+            for source in results:
+                source_id = source.get("id")
+                if source_id:
+                    sources[source_id] = source
+                    self._cache_set(("get_sources_by_ids", source_id.split("/")[-1]), source)
+
+        return sources
+
     def group_works_by_source(
         self,
         topic_ids: List[str],
@@ -116,19 +280,28 @@ class OpenAlexClient:
         if not topic_ids:
             return []
 
+        key = ("group_works_by_source", tuple(topic_ids), from_date)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
-            return (
-                pyalex.Works()
-                .filter(
-                    topics={"id": topic_ids},
-                    type="article",
-                    from_publication_date=from_date,
+            with self._request_slots:
+                groups = (
+                    pyalex.Works()
+                    .filter(
+                        topics={"id": topic_ids},
+                        type="article",
+                        from_publication_date=from_date,
+                    )
+                    .group_by("primary_location.source.id")
+                    .get()
                 )
-                .group_by("primary_location.source.id")
-                .get()
-            )
+            self._cache_set(key, groups)
+            return groups
         except Exception as e:
             logger.error(f"Error grouping works by source: {e}")
+            self.record_failure()
             return []
 
     def find_sources_by_subfield_id(
@@ -153,19 +326,28 @@ class OpenAlexClient:
         if not subfield_id:
             return []
 
+        key = ("find_sources_by_subfield_id", subfield_id, from_date, per_page)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
-            return (
-                pyalex.Works()
-                .filter(
-                    topics={"subfield": {"id": subfield_id}},
-                    type="article",
-                    from_publication_date=from_date,
+            with self._request_slots:
+                groups = (
+                    pyalex.Works()
+                    .filter(
+                        topics={"subfield": {"id": subfield_id}},
+                        type="article",
+                        from_publication_date=from_date,
+                    )
+                    .group_by("primary_location.source.id")
+                    .get(per_page=per_page)
                 )
-                .group_by("primary_location.source.id")
-                .get(per_page=per_page)
-            )
+            self._cache_set(key, groups)
+            return groups
         except Exception as e:
             logger.error(f"Error finding sources by subfield {subfield_id}: {e}")
+            self.record_failure()
             return []
 
     # ==================== ASYNC METHODS FOR UNIVERSAL MODE ====================
@@ -213,9 +395,11 @@ class OpenAlexClient:
                     return data.get("results", [])
                 else:
                     logger.error(f"OpenAlex API error: {response.status_code}")
+                    self.record_failure()
                     return []
         except Exception as e:
             logger.error(f"Async OpenAlex search failed: {e}")
+            self.record_failure()
             return []
 
     async def get_sources_async(
@@ -263,9 +447,11 @@ class OpenAlexClient:
                     return data.get("results", [])
                 else:
                     logger.error(f"OpenAlex Sources API error: {response.status_code}")
+                    self.record_failure()
                     return []
         except Exception as e:
             logger.error(f"Async OpenAlex sources failed: {e}")
+            self.record_failure()
             return []
 
     async def get_sources_by_subfield_async(
@@ -293,11 +479,20 @@ class OpenAlexClient:
 
 # Global client instance
 _client: Optional[OpenAlexClient] = None
+_client_lock = threading.Lock()
 
 
 def get_client() -> OpenAlexClient:
-    """Get or create global client instance."""
+    """
+    Get or create global client instance.
+
+    Search stages call this from worker threads, so creation is locked to
+    keep a single client (one response cache, one request limit). Once
+    created, the lookup is lock-free.
+    """
     global _client
     if _client is None:
-        _client = OpenAlexClient()
+        with _client_lock:
+            if _client is None:
+                _client = OpenAlexClient()
     return _client
@@ -12,7 +12,7 @@ from collections import Counter
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Set
 
-from .client import get_client
+from .client import ANALYSIS_WORK_SELECT_FIELDS, get_client
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +78,9 @@ class ConceptsAnalyzer:
         concept_data: Dict[str, Dict] = {}
 
         # Search for similar works
-        works = self.client.search_works(search_query, per_page=max_works)
+        works = self.client.search_works(
+            search_query, per_page=max_works, select=ANALYSIS_WORK_SELECT_FIELDS
+        )
 
         if not works:
             logger.warning(f"No works found for concept analysis: {search_query[:50]}...")
@@ -5,7 +5,7 @@ Sets up pyalex library with email and API key for polite pool.
 """
 import pyalex
 from functools import lru_cache
-from typing import Optional
+from typing import Optional, Tuple
 
 from app.core.config import get_settings as get_app_settings
 
@@ -18,6 +18,24 @@ class OpenAlexConfig:
     MIN_JOURNAL_WORKS: int = 500
     WORKS_PER_PAGE: int = 200
     MAX_SEARCH_TERMS: int = 10
+    MAX_CONCURRENT_REQUESTS: int = 8  # Worker threads one search fans out to
+    # Process-wide cap on in-flight OpenAlex requests, shared by every
+    # concurrent search. Intentional global rate limit: at typical ~0.6s
+    # latency, 6 in flight stays under OpenAlex's ~10 req/s polite-pool limit.
+    MAX_INFLIGHT_REQUESTS: int = 6
+    # Skip the 2nd works page when page 1 already shows a clear top set
+    PAGE2_SKIP_MIN_SOURCES: int = 60  # Distinct journals on page 1
+    PAGE2_SKIP_CONCENTRATION: float = 0.5  # Share of works in the top 10 journals
+    # Request page 2 alongside page 1 (saves a round trip, may waste a request)
+    PREFETCH_WORKS_PAGE2: bool = True
+    # Start the broader fallback search early when detection is this uncertain
+    SPECULATIVE_FALLBACK_CONFIDENCE: float = 0.3
+    # Secondary disciplines in the primary's field need this confidence
+    # to get their own subfield search
+    SECONDARY_DISCIPLINE_MIN_CONFIDENCE: float = 0.3
+    # Full text-search results, reused when the same query is re-run
+    TEXT_SEARCH_CACHE_TTL_SECONDS: int = 3600
+    TEXT_SEARCH_CACHE_MAX_ENTRIES: int = 512
 
     def __init__(self):
         self._configure_pyalex()
@@ -45,3 +63,35 @@ def get_max_results() -> int:
 def get_min_journal_works() -> int:
     """Get minimum works count for journal inclusion."""
     return get_config().MIN_JOURNAL_WORKS
+
+
+def get_max_concurrent_requests() -> int:
+    """Get maximum number of worker threads a single search fans out to."""
+    return get_config().MAX_CONCURRENT_REQUESTS
+
+
+def get_page2_skip_thresholds() -> Tuple[int, float]:
+    """Get (min distinct sources, min top-10 concentration) for skipping works page 2."""
+    config = get_config()
+    return config.PAGE2_SKIP_MIN_SOURCES, config.PAGE2_SKIP_CONCENTRATION
+
+
+def get_prefetch_works_page2() -> bool:
+    """Get whether works page 2 is requested concurrently with page 1."""
+    return get_config().PREFETCH_WORKS_PAGE2
+
+
+def get_speculative_fallback_confidence() -> float:
+    """Get discipline confidence below which the fallback search starts early."""
+    return get_config().SPECULATIVE_FALLBACK_CONFIDENCE
+
+
+def get_secondary_discipline_min_confidence() -> float:
+    """Get confidence below which same-field secondary disciplines are not searched."""
+    return get_config().SECONDARY_DISCIPLINE_MIN_CONFIDENCE
+
+
+def get_text_search_cache_settings() -> Tuple[int, int]:
+    """Get (TTL seconds, max entries) for the text-search result cache."""
+    config = get_config()
+    return config.TEXT_SEARCH_CACHE_TTL_SECONDS, config.TEXT_SEARCH_CACHE_MAX_ENTRIES
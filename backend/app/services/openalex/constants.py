@@ -9,10 +9,12 @@ Note: Discipline detection now uses OpenAlex's ML classification directly.
 The hardcoded DISCIPLINE_KEYWORDS and KEY_JOURNALS_BY_DISCIPLINE have been removed.
 """
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Set
 
 from app.core.logging import get_logger
+from .utils import normalize_journal_name
 
 logger = get_logger(__name__)
 
@@ -152,12 +154,15 @@ RELEVANT_TOPIC_KEYWORDS: Dict[str, List[str]] = {
 }
 
 
-def load_core_journals() -> Set[str]:
+@lru_cache(maxsize=1)
+def load_core_journals() -> FrozenSet[str]:
     """
     Load core journals list from JSON file.
 
+    The file is read and normalized once per process.
+
     Returns:
-        Set of normalized journal names for boosting.
+        Frozen set of normalized journal names for boosting.
     """
     core_journals: Set[str] = set()
 
@@ -168,14 +173,12 @@ def load_core_journals() -> Set[str]:
                 data = json.load(f)
                 for discipline in data.get("disciplines", []):
                     for journal in discipline.get("journals", []):
-                        name = journal.get("title", "")
                         # Normalize: lowercase, alphanumeric only
-                        normalized = "".join(
-                            c.lower() for c in name if c.isalnum() or c.isspace()
+                        core_journals.add(
+                            normalize_journal_name(journal.get("title", ""))
                         )
-                        core_journals.add(" ".join(normalized.split()))
             logger.info(f"Loaded {len(core_journals)} core journals for boosting.")
     except Exception as e:
         logger.warning(f"Failed to load core journals: {e}")
 
-    return core_journals
+    return frozenset(core_journals)
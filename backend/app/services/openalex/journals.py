@@ -129,6 +129,15 @@ def merge_journal_results(
         journal.relevance_score = 1.0
         merged[jid] = journal
 
+    # New topic journals need full details - reuse full records we already
+    # have and fetch the rest in one batched request
+    missing_ids = [
+        source_id for source_id, data in topic_journals.items()
+        if source_id not in merged
+        and "works_count" not in (data.get("source") or {})
+    ]
+    fetched_sources = client.get_sources_by_ids(missing_ids) if missing_ids else {}
+
     # Add/boost journals from topic search
     for source_id, data in topic_journals.items():
         if source_id in merged:
@@ -136,8 +145,10 @@ def merge_journal_results(
             merged[source_id].relevance_score += 2.0
             merged[source_id].match_reason = "Found in both keyword and topic search"
         else:
-            # New from topics - load full details
-            full_source = client.get_source_by_id(source_id)
+            # New from topics - use full details
+            full_source = data.get("source")
+            if not full_source or "works_count" not in full_source:
+                full_source = fetched_sources.get(source_id)
             if full_source:
                 works_count = full_source.get("works_count", 0)
                 if works_count >= min_works:
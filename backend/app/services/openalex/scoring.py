@@ -4,6 +4,7 @@ Journal Relevance Scoring
 Weighted scoring algorithm for ranking journals.
 Includes enhanced scoring with multi-discipline and article type awareness.
 """
+import re
 from typing import List, Set, Tuple, Dict, Optional
 from dataclasses import dataclass, field
 
@@ -68,7 +69,31 @@ def calculate_quality_tier(journal: Journal) -> int:
 # Enhanced Scoring Context and Scorer
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
+class JournalText:
+    """
+    Lowercase journal name and topics, shared by every scoring and relevance pass.
+
+    Built once per journal by journal_text().
+    """
+    name_lower: str
+    topics_lower: List[str]
+    # Topics joined by "\n": one haystack for "any topic contains" checks
+    # (keywords never contain "\n", so no false matches across topics)
+    topics_blob: str
+
+
+def journal_text(journal: Journal) -> JournalText:
+    """Lowercase a journal's name and topics once for all matching passes."""
+    topics_lower = [t.lower() for t in journal.topics]
+    return JournalText(
+        name_lower=journal.name.lower(),
+        topics_lower=topics_lower,
+        topics_blob="\n".join(topics_lower),
+    )
+
+
+@dataclass(slots=True)
 class ScoringContext:
     """
     Context for enhanced scoring with multi-discipline and article type info.
@@ -79,6 +104,21 @@ class ScoringContext:
     prefer_open_access: bool = False
 
 
+@dataclass(slots=True)
+class PreparedContext:
+    """
+    Context-derived lookups shared by every journal scored for one search.
+
+    Built once by EnhancedJournalScorer.prepare_context().
+    """
+    strong_terms: List[str]  # Lowercase search terms with len > 4
+    # (subfield, name, top 3 evidence keywords) per discipline, lowercase
+    disciplines: List[Tuple[str, str, List[str]]]
+    expected_keywords: Set[str]
+    article_type_id: str
+    prefer_open_access: bool
+
+
 class EnhancedJournalScorer:
     """
     Enhanced scoring with multi-discipline and article type awareness.
@@ -114,6 +154,70 @@ class EnhancedJournalScorer:
         "quality_tier_points": 8,  # Points per tier (max 32 for tier 4)
     }
 
+    # Article type fit: journal-name terms per article type (built once)
+    REVIEW_TYPE_IDS = frozenset(
+        {"systematic_review", "systematic_review_meta_analysis", "meta_analysis"}
+    )
+    REVIEW_NAME_TERMS = ("review", "systematic", "evidence", "synthesis")
+    TRIAL_NAME_TERMS = ("clinical", "trial", "controlled")
+
+    def __init__(self):
+        # Bind weights once - score_journal runs per candidate journal
+        weights = self.WEIGHTS
+        self._w_topic = weights["topic_match"]
+        self._w_keyword = weights["keyword_match"]
+        self._w_name = weights["journal_name_match"]
+        self._w_h_index = weights["h_index_factor"]
+        self._w_citation = weights["citation_rate_factor"]
+        self._w_primary = weights["primary_discipline_match"]
+        self._w_secondary = weights["secondary_discipline_match"]
+        self._w_cross = weights["cross_discipline_coverage"]
+        self._w_article_type = weights["article_type_fit"]
+        self._w_irrelevant = weights["topic_relevance_penalty"]
+        self._w_tier = weights["quality_tier_points"]
+
+    def prepare_context(
+        self,
+        context: ScoringContext,
+        search_terms: Optional[List[str]] = None,
+    ) -> PreparedContext:
+        """
+        Precompute the context-derived lookups used for every journal.
+
+        Args:
+            context: Scoring context with detected disciplines and article type.
+            search_terms: Original search terms (defaults to context keywords).
+
+        Returns:
+            PreparedContext to reuse across all journals of a search.
+        """
+        search_terms = search_terms or context.keywords
+
+        disciplines = []
+        for disc in context.detected_disciplines:
+            # openalex_subfield_id can be string (name) or int (numeric ID) - handle both
+            subfield_raw = disc.get("openalex_subfield_id", "")
+            subfield = str(subfield_raw).lower() if subfield_raw else ""
+            name = disc.get("name", "").lower()
+            evidence = [kw.lower() for kw in disc.get("evidence", [])[:3]]
+            disciplines.append((subfield, name, evidence))
+
+        # Build expected keywords from context
+        expected_keywords = set()
+        for disc in context.detected_disciplines:
+            evidence = disc.get("evidence", [])
+            expected_keywords.update(e.lower() for e in evidence)
+        expected_keywords.update(kw.lower() for kw in context.keywords)
+
+        article_type = context.article_type
+        return PreparedContext(
+            strong_terms=[term.lower() for term in search_terms if len(term) > 4],
+            disciplines=disciplines,
+            expected_keywords=expected_keywords,
+            article_type_id=article_type.get("type", "") if article_type else "",
+            prefer_open_access=context.prefer_open_access,
+        )
+
     def score_journal(
         self,
         journal: Journal,
@@ -125,6 +229,8 @@ class EnhancedJournalScorer:
         """
         Calculate enhanced relevance score for a journal.
 
+        Use score_journals() when scoring many journals for one context.
+
         Args:
             journal: Journal to score.
             context: Scoring context with detected disciplines and article type.
@@ -135,89 +241,154 @@ class EnhancedJournalScorer:
         Returns:
             Relevance score (will be normalized later).
         """
+        return self._score_prepared(
+            journal,
+            self.prepare_context(context, search_terms),
+            is_topic_match,
+            is_keyword_match,
+        )
+
+    def score_journals(
+        self,
+        journals: List[Journal],
+        context: ScoringContext,
+        topic_match_ids: Set[str],
+        keyword_match_ids: Set[str],
+        search_terms: Optional[List[str]] = None,
+        texts: Optional[List[JournalText]] = None,
+    ) -> List[float]:
+        """
+        Score a batch of journals against one context.
+
+        The context is prepared once instead of per journal.
+
+        Args:
+            journals: Journals to score.
+            context: Scoring context with detected disciplines and article type.
+            topic_match_ids: IDs of journals found via topic search.
+            keyword_match_ids: IDs of journals found via keyword search.
+            search_terms: Original search terms.
+            texts: Precomputed journal_text() per journal, in the same order.
+
+        Returns:
+            Relevance scores, in the same order as journals.
+        """
+        prepared = self.prepare_context(context, search_terms)
+        score_prepared = self._score_prepared
+        if texts is None:
+            texts = [journal_text(journal) for journal in journals]
+        return [
+            score_prepared(
+                journal,
+                prepared,
+                journal.id in topic_match_ids,
+                journal.id in keyword_match_ids,
+                text,
+            )
+            for journal, text in zip(journals, texts)
+        ]
+
+    def _score_prepared(
+        self,
+        journal: Journal,
+        prepared: PreparedContext,
+        is_topic_match: bool,
+        is_keyword_match: bool,
+        text: Optional[JournalText] = None,
+    ) -> float:
+        """Score one journal against a prepared context."""
         score = 0.0
-        journal_name_lower = journal.name.lower()
-        search_terms = search_terms or context.keywords
+        if text is None:
+            text = journal_text(journal)
+        journal_name_lower = text.name_lower
+        topics_lower = text.topics_lower
+        topics_blob = text.topics_blob
 
         # 1. Base scoring factors (existing)
         if is_topic_match:
-            score += self.WEIGHTS["topic_match"]
+            score += self._w_topic
 
         if is_keyword_match:
-            score += self.WEIGHTS["keyword_match"]
+            score += self._w_keyword
 
         # Exact title match
-        for term in search_terms:
-            if len(term) > 4 and term.lower() in journal_name_lower:
-                score += self.WEIGHTS["journal_name_match"]
+        for term_lower in prepared.strong_terms:
+            if term_lower in journal_name_lower:
+                score += self._w_name
                 break
 
         # PHASE 1: Use quality tier instead of raw metrics for bounded contribution
         quality_tier = calculate_quality_tier(journal)
-        score += quality_tier * self.WEIGHTS["quality_tier_points"]
+        score += quality_tier * self._w_tier
 
         # Legacy metrics with minimal weight (for fine-tuning only)
         h_index = journal.metrics.h_index or 0
-        score += h_index * self.WEIGHTS["h_index_factor"]
+        score += h_index * self._w_h_index
 
         citation_rate = journal.metrics.two_yr_mean_citedness or 0
-        score += citation_rate * self.WEIGHTS["citation_rate_factor"]
+        score += citation_rate * self._w_citation
+
+        if prepared.disciplines:
+            # Check if journal publishes in a subfield (exact topic name)
+            journal_subfields = set(topics_lower)
 
-        # 2. NEW: Multi-discipline matching
-        score += self._score_discipline_match(journal, context.detected_disciplines)
+            # 2. NEW: Multi-discipline matching
+            score += self._score_discipline_match(
+                journal_name_lower, journal_subfields, topics_blob, prepared.disciplines
+            )
 
-        # 3. NEW: Cross-discipline coverage
-        score += self._score_cross_discipline(journal, context.detected_disciplines)
+            # 3. NEW: Cross-discipline coverage
+            score += self._score_cross_discipline(
+                journal_name_lower, journal_subfields, topics_blob, prepared.disciplines
+            )
 
         # 4. NEW: Article type fit
-        score += self._score_article_type_fit(journal, context.article_type)
+        score += self._score_article_type_fit(
+            journal, journal_name_lower, prepared.article_type_id
+        )
 
         # 5. NEW: Topic relevance validation
-        score += self._validate_topic_relevance(journal, context)
+        score += self._validate_topic_relevance(topics_lower, prepared.expected_keywords)
 
         # 6. Open access preference
-        if context.prefer_open_access and journal.is_oa:
+        if prepared.prefer_open_access and journal.is_oa:
             score += 15
 
         return max(score, 0)  # Don't go negative
 
     def _score_discipline_match(
         self,
-        journal: Journal,
-        disciplines: List[Dict]
+        journal_name_lower: str,
+        journal_subfields: Set[str],
+        topics_blob: str,
+        disciplines: List[Tuple[str, str, List[str]]],
     ) -> float:
         """Score based on matching detected disciplines."""
         score = 0.0
-        journal_subfields = self._get_journal_subfields(journal)
-        journal_name_lower = journal.name.lower()
-
-        for i, disc in enumerate(disciplines):
-            # openalex_subfield_id can be string (name) or int (numeric ID) - handle both
-            subfield_raw = disc.get("openalex_subfield_id", "")
-            subfield = str(subfield_raw).lower() if subfield_raw else ""
-            name = disc.get("name", "").lower()
 
+        for i, (subfield, name, _) in enumerate(disciplines):
             # Check if journal publishes in this subfield
             subfield_match = subfield and subfield in journal_subfields
 
             # Check if discipline name appears in journal name/topics
             name_match = name and (
-                name in journal_name_lower or
-                any(name in t.lower() for t in journal.topics)
+                name in journal_name_lower or name in topics_blob
             )
 
             if subfield_match or name_match:
                 if i == 0:  # Primary discipline
-                    score += self.WEIGHTS["primary_discipline_match"]
+                    score += self._w_primary
                 else:  # Secondary disciplines
-                    score += self.WEIGHTS["secondary_discipline_match"]
+                    score += self._w_secondary
 
         return score
 
     def _score_cross_discipline(
         self,
-        journal: Journal,
-        disciplines: List[Dict]
+        journal_name_lower: str,
+        journal_subfields: Set[str],
+        topics_blob: str,
+        disciplines: List[Tuple[str, str, List[str]]],
     ) -> float:
         """
         Bonus for journals that cover multiple detected disciplines.
@@ -228,98 +399,73 @@ class EnhancedJournalScorer:
         if len(disciplines) < 2:
             return 0.0
 
-        journal_subfields = self._get_journal_subfields(journal)
-        journal_name_lower = journal.name.lower()
-
         overlap_count = 0
-        for disc in disciplines[:3]:  # Check top 3 disciplines
-            # openalex_subfield_id can be string (name) or int (numeric ID) - handle both
-            subfield_raw = disc.get("openalex_subfield_id", "")
-            subfield = str(subfield_raw).lower() if subfield_raw else ""
-            name = disc.get("name", "").lower()
-            evidence = disc.get("evidence", [])
-
+        for subfield, _, evidence in disciplines[:3]:  # Check top 3 disciplines
             # Check for subfield match
             if subfield and subfield in journal_subfields:
                 overlap_count += 1
                 continue
 
-            # Check for evidence keywords in journal topics
-            for kw in evidence[:3]:  # Top 3 evidence keywords
-                if kw.lower() in journal_name_lower:
+            # Check for evidence keywords in journal topics (top 3 evidence keywords)
+            for kw in evidence:
+                if kw in journal_name_lower:
                     overlap_count += 1
                     break
-                for topic in journal.topics:
-                    if kw.lower() in topic.lower():
-                        overlap_count += 1
-                        break
+                if kw in topics_blob:
+                    overlap_count += 1
 
         # Give full bonus if journal covers 2+ disciplines
         if overlap_count >= 2:
-            return self.WEIGHTS["cross_discipline_coverage"]
+            return self._w_cross
         elif overlap_count == 1:
-            return self.WEIGHTS["cross_discipline_coverage"] * 0.3
+            return self._w_cross * 0.3
 
         return 0.0
 
     def _score_article_type_fit(
         self,
         journal: Journal,
-        article_type: Optional[Dict]
+        journal_name_lower: str,
+        type_id: str,
     ) -> float:
         """Score based on article type fit with journal profile."""
-        if not article_type:
+        if not type_id:
             return 0.0
 
-        type_id = article_type.get("type", "")
-        journal_name_lower = journal.name.lower()
-
         # Check for review-focused journals
-        if type_id in ["systematic_review", "systematic_review_meta_analysis", "meta_analysis"]:
-            review_terms = ["review", "systematic", "evidence", "synthesis"]
-            if any(term in journal_name_lower for term in review_terms):
-                return self.WEIGHTS["article_type_fit"]
+        if type_id in self.REVIEW_TYPE_IDS:
+            if any(term in journal_name_lower for term in self.REVIEW_NAME_TERMS):
+                return self._w_article_type
             # High-impact journals also good for major reviews
             if (journal.metrics.h_index or 0) > 100:
-                return self.WEIGHTS["article_type_fit"] * 0.5
+                return self._w_article_type * 0.5
 
         # Check for case report journals
         if type_id == "case_report":
             if "case" in journal_name_lower:
-                return self.WEIGHTS["article_type_fit"]
+                return self._w_article_type
 
         # Check for RCT - prefer clinical/trials journals
         if type_id == "randomized_controlled_trial":
-            trial_terms = ["clinical", "trial", "controlled"]
-            if any(term in journal_name_lower for term in trial_terms):
-                return self.WEIGHTS["article_type_fit"] * 0.5
+            if any(term in journal_name_lower for term in self.TRIAL_NAME_TERMS):
+                return self._w_article_type * 0.5
 
         return 0.0
 
     def _validate_topic_relevance(
         self,
-        journal: Journal,
-        context: ScoringContext
+        topics_lower: List[str],
+        expected_keywords: Set[str],
     ) -> float:
         """
         Validate that journal topics are actually relevant.
         Apply penalty for clearly irrelevant topics.
         """
-        if not journal.topics:
-            return 0.0
-
-        # Build expected keywords from context
-        expected_keywords = set()
-        for disc in context.detected_disciplines:
-            evidence = disc.get("evidence", [])
-            expected_keywords.update(e.lower() for e in evidence)
-        expected_keywords.update(kw.lower() for kw in context.keywords)
-
-        if not expected_keywords:
+        if not topics_lower or not expected_keywords:
             return 0.0
 
         # Check top 5 journal topics for relevance
-        topic_names = [t.lower() for t in journal.topics[:5]]
+        topic_names = topics_lower[:5]
 
         relevant_count = 0
         for topic in topic_names:
@@ -329,47 +475,175 @@ class EnhancedJournalScorer:
                     break
 
         # If majority of top topics are irrelevant, apply penalty
-        if len(topic_names) > 0:
-            relevance_ratio = relevant_count / len(topic_names)
-            if relevance_ratio < 0.2:
-                return self.WEIGHTS["topic_relevance_penalty"]
+        relevance_ratio = relevant_count / len(topic_names)
+        if relevance_ratio < 0.2:
+            return self._w_irrelevant
 
         return 0.0
 
-    def _get_journal_subfields(self, journal: Journal) -> set:
-        """Extract subfield names from journal topics (lowercase)."""
-        subfields = set()
-        for topic in journal.topics:
-            # Topics might contain subfield info
-            subfields.add(topic.lower())
-        return subfields
 
+# =============================================================================
+# Fused Scoring + Match Details
+# =============================================================================
+
+@dataclass(slots=True)
+class PreparedQuery:
+    """
+    Query-side data shared by every journal scored for one search.
 
-def generate_match_details(
+    Built once per search so the per-journal loop doesn't re-lowercase
+    and re-tokenize the same search terms and discipline.
+    """
+    search_terms: List[str]
+    terms_lower: List[str]
+    strong_terms: List[Tuple[str, str]]  # (original, lowercase) for len > 4
+    discipline: str
+    discipline_words: List[str]
+    fallback_pattern: Optional[re.Pattern]  # Static keywords for legacy disciplines
+
+
+@dataclass(slots=True)
+class ScoreResult:
+    """Relevance score plus the human-readable explanation behind it."""
+    score: float
+    details: List[str] = field(default_factory=list)
+    matched_topics: List[str] = field(default_factory=list)
+
+
+# Legacy disciplines' static keywords compiled into one alternation each, so
+# a single C-level search replaces a Python loop of substring checks. Built
+# once over the fixed keys; free-text disciplines simply miss.
+_FALLBACK_KEYWORD_PATTERNS: Dict[str, re.Pattern] = {
+    discipline: re.compile("|".join(re.escape(k) for k in keywords))
+    for discipline, keywords in RELEVANT_TOPIC_KEYWORDS.items()
+    if keywords
+}
+
+
+def prepare_query(discipline: str, search_terms: List[str]) -> PreparedQuery:
+    """
+    Precompute the query-side inputs for score_and_explain.
+
+    Args:
+        discipline: Detected discipline/subfield.
+        search_terms: Original search terms.
+
+    Returns:
+        PreparedQuery to reuse across all journals of a search.
+    """
+    discipline_lower = discipline.lower() if discipline else ""
+
+    # Extract key words from the discipline/subfield (split on commas and spaces)
+    discipline_words = [
+        w.strip() for w in discipline_lower.replace(",", " ").split()
+        if len(w.strip()) > 3
+    ]
+
+    return PreparedQuery(
+        search_terms=search_terms,
+        terms_lower=[term.lower() for term in search_terms],
+        # Only terms length > 4 count for title matches (avoid generic matches)
+        strong_terms=[(term, term.lower()) for term in search_terms if len(term) > 4],
+        discipline=discipline,
+        discipline_words=discipline_words,
+        fallback_pattern=_FALLBACK_KEYWORD_PATTERNS.get(discipline),
+    )
+
+
+def score_and_explain(
     journal: Journal,
-    discipline: str,
+    query: PreparedQuery,
     is_topic_match: bool,
     is_keyword_match: bool,
-    search_terms: List[str],
-) -> Tuple[List[str], List[str]]:
+    explain: bool = True,
+    text: Optional[JournalText] = None,
+) -> ScoreResult:
     """
-    Generate human-readable match details for a journal.
+    Calculate the relevance score and match details in a single pass.
 
-    This explains WHY this journal is a good fit (Story 1.1).
+    The substring matching (title terms, discipline words, topics) runs once
+    and feeds both the numeric score and the explanation (Story 1.1).
+
+    Scoring breakdown:
+    1. Base Score: 0.0
+    2. Topic Match: +20
+    3. Keyword Match: +10
+    4. Exact Title Match: +50 (if journal name matches search terms)
+    5. Quality Boost: H-index * 0.05
+    5b. Citation Rate Boost: 2yr_mean_citedness * 1.5
+    6. Discipline Boost: +15 to +25
+    7. Core Journal Safety Net: +100 (DISABLED)
 
     Args:
-        journal: Journal to analyze.
-        discipline: Detected discipline/subfield.
+        journal: Journal to score.
+        query: Prepared query from prepare_query().
         is_topic_match: Found via topic search.
         is_keyword_match: Found via keyword search.
-        search_terms: Original search terms.
+        explain: Build match details and matched topics (skip for score-only callers).
+        text: Precomputed journal_text() for the journal (built if omitted).
 
     Returns:
-        Tuple of (match_details list, matched_topics list).
+        ScoreResult with score, match details, and matched topics.
     """
+    score = 0.0
+    if text is None:
+        text = journal_text(journal)
+    journal_name_lower = text.name_lower
+    # "any topic contains w" is a single C-level search of the blob
+    topics_blob = text.topics_blob
+    discipline_words = query.discipline_words
+
+    # 2. Topic Match (+20)
+    if is_topic_match:
+        score += 20.0
+
+    # 3. Keyword Match (+10)
+    if is_keyword_match:
+        score += 10.0
+
+    # 4. Exact Title Match (+50)
+    # Check if any strong search term is part of the journal name
+    matching_terms = [
+        term for term, term_lower in query.strong_terms
+        if term_lower in journal_name_lower
+    ]
+    if matching_terms:
+        score += 50.0
+
+    # 5. Quality Boost (H-index * 0.05)
+    # Example: Nature (H~1300) -> +65 points
+    h_index = journal.metrics.h_index or 0
+    score += h_index * 0.05
+
+    # 5b. Citation Rate Boost (2yr_mean_citedness * 1.5)
+    # Similar to Impact Factor - higher means more citations per paper
+    # Example: Nature (citedness ~45) -> +67.5 points
+    citation_rate = journal.metrics.two_yr_mean_citedness or 0
+    score += citation_rate * 1.5
+
+    # 6. Discipline/Subfield Boost (+15 to +25)
+    # Discipline can be an OpenAlex subfield like "Endocrinology, Diabetes and Metabolism"
+    # We check if the journal name or topics contain words from the subfield
+    discipline_name_hit = any(word in journal_name_lower for word in discipline_words)
+
+    if discipline_name_hit:
+        score += 25.0  # Higher boost for name match
+    elif any(word in topics_blob for word in discipline_words):
+        score += 15.0  # Standard boost for topic match
+    elif query.fallback_pattern:
+        # Fallback: use static keywords for legacy disciplines
+        fallback = query.fallback_pattern
+        if fallback.search(journal_name_lower) or fallback.search(topics_blob):
+            score += 15.0
+
+    # 7. Core Journal Safety Net - DISABLED
+    # Was giving +100 to generic prestigious journals (NEJM, Lancet)
+    # causing them to rank above topic-relevant journals
+
+    if not explain:
+        return ScoreResult(score=score)
+
     details: List[str] = []
-    matched_topics: List[str] = []
-    journal_name_lower = journal.name.lower()
 
     # 1. Topic/Keyword match explanation
     if is_topic_match and is_keyword_match:
@@ -380,35 +654,20 @@ def generate_match_details(
         details.append("Keyword match: Journal covers your research terms")
 
     # 2. Name match with search terms
-    matching_terms = [
-        term for term in search_terms
-        if len(term) > 4 and term.lower() in journal_name_lower
-    ]
     if matching_terms:
         terms_str = ", ".join(matching_terms[:3])
         details.append(f"Direct relevance: Journal name includes '{terms_str}'")
 
     # 3. Discipline/subfield relevance
-    discipline_lower = discipline.lower() if discipline else ""
-    discipline_words = [
-        w.strip() for w in discipline_lower.replace(",", " ").split()
-        if len(w.strip()) > 3
-    ]
-
-    # Check journal name for discipline words
-    for word in discipline_words:
-        if word in journal_name_lower:
-            details.append(f"Specialized in {discipline}")
-            break
+    if discipline_name_hit:
+        details.append(f"Specialized in {query.discipline}")
 
     # 4. Quality indicators
-    h_index = journal.metrics.h_index or 0
     if h_index >= 200:
         details.append(f"High-impact journal (H-index: {h_index})")
     elif h_index >= 50:
         details.append(f"Established journal (H-index: {h_index})")
 
-    citation_rate = journal.metrics.two_yr_mean_citedness or 0
     if citation_rate >= 10:
         details.append(f"High citation rate ({citation_rate:.1f} avg citations)")
 
@@ -418,30 +677,54 @@ def generate_match_details(
     if journal.is_in_doaj:
         details.append("DOAJ verified: Quality open access journal")
 
-    # 6. Find matching topics
-    journal_topics_lower = [t.lower() for t in journal.topics]
-    for term in search_terms:
-        term_lower = term.lower()
-        for topic in journal.topics:
-            if term_lower in topic.lower():
-                if topic not in matched_topics:
-                    matched_topics.append(topic)
-
-    # Also check discipline words against topics
-    for word in discipline_words:
-        for topic in journal.topics:
-            if word in topic.lower():
-                if topic not in matched_topics:
-                    matched_topics.append(topic)
-
-    # Limit to top 5 matched topics
-    matched_topics = matched_topics[:5]
+    # 6. Find matching topics (search terms first, then discipline words)
+    journal_topics = list(zip(journal.topics, text.topics_lower))
+    matched_topics: List[str] = []
+    for word in query.terms_lower + discipline_words:
+        if word not in topics_blob:
+            continue
+        for topic, topic_lower in journal_topics:
+            if word in topic_lower and topic not in matched_topics:
+                matched_topics.append(topic)
 
     # Ensure at least one detail if nothing found
     if not details:
         details.append("General match based on research area")
 
-    return details, matched_topics
+    # Limit to top 5 matched topics
+    return ScoreResult(score=score, details=details, matched_topics=matched_topics[:5])
+
+
+def generate_match_details(
+    journal: Journal,
+    discipline: str,
+    is_topic_match: bool,
+    is_keyword_match: bool,
+    search_terms: List[str],
+) -> Tuple[List[str], List[str]]:
+    """
+    Generate human-readable match details for a journal.
+
+    This explains WHY this journal is a good fit (Story 1.1).
+    Thin wrapper around score_and_explain().
+
+    Args:
+        journal: Journal to analyze.
+        discipline: Detected discipline/subfield.
+        is_topic_match: Found via topic search.
+        is_keyword_match: Found via keyword search.
+        search_terms: Original search terms.
+
+    Returns:
+        Tuple of (match_details list, matched_topics list).
+    """
+    result = score_and_explain(
+        journal,
+        prepare_query(discipline, search_terms),
+        is_topic_match,
+        is_keyword_match,
+    )
+    return result.details, result.matched_topics
 
 
 def calculate_relevance_score(
@@ -455,15 +738,7 @@ def calculate_relevance_score(
     """
     Calculate weighted relevance score.
 
-    Scoring breakdown:
-    1. Base Score: 0.0
-    2. Topic Match: +20
-    3. Keyword Match: +10
-    4. Exact Title Match: +50 (if journal name matches search terms)
-    5. Quality Boost: H-index * 0.05
-    5b. Citation Rate Boost: 2yr_mean_citedness * 1.5
-    6. Discipline Boost: +15 to +25
-    7. Core Journal Safety Net: +100 (DISABLED)
+    Thin wrapper around score_and_explain() - see it for the scoring breakdown.
 
     Args:
         journal: Journal to score.
@@ -471,90 +746,16 @@ def calculate_relevance_score(
         is_topic_match: Found via topic search.
         is_keyword_match: Found via keyword search.
         search_terms: Original search terms.
-        core_journals: Set of core journal names (normalized).
+        core_journals: Set of core journal names (normalized). Unused while
+            the core journal boost is disabled.
 
     Returns:
         Relevance score (higher = more relevant).
     """
-    score = 0.0
-    journal_name_lower = journal.name.lower()
-
-    # 2. Topic Match (+20)
-    if is_topic_match:
-        score += 20.0
-
-    # 3. Keyword Match (+10)
-    if is_keyword_match:
-        score += 10.0
-
-    # 4. Exact Title Match (+50)
-    # Check if any strong search term is part of the journal name
-    # Only check terms length > 4 to avoid generic matches
-    for term in search_terms:
-        if len(term) > 4 and term.lower() in journal_name_lower:
-            score += 50.0
-            break
-
-    # 5. Quality Boost (H-index * 0.05)
-    # Example: Nature (H~1300) -> +65 points
-    h_index = journal.metrics.h_index or 0
-    score += h_index * 0.05
-
-    # 5b. Citation Rate Boost (2yr_mean_citedness * 1.5)
-    # Similar to Impact Factor - higher means more citations per paper
-    # Example: Nature (citedness ~45) -> +67.5 points
-    citation_rate = journal.metrics.two_yr_mean_citedness or 0
-    score += citation_rate * 1.5
-
-    # 6. Discipline/Subfield Boost (+15 to +25)
-    # Now discipline can be an OpenAlex subfield like "Endocrinology, Diabetes and Metabolism"
-    # We check if the journal name or topics contain words from the subfield
-    discipline_lower = discipline.lower() if discipline else ""
-    is_discipline_relevant = False
-
-    # Extract key words from the discipline/subfield (split on commas and spaces)
-    discipline_words = [
-        w.strip() for w in discipline_lower.replace(",", " ").split()
-        if len(w.strip()) > 3
-    ]
-
-    # Check if journal name contains discipline words
-    for word in discipline_words:
-        if word in journal_name_lower:
-            is_discipline_relevant = True
-            score += 25.0  # Higher boost for name match
-            break
-
-    # Also check journal topics against discipline words
-    if not is_discipline_relevant:
-        for topic in journal.topics:
-            topic_lower = topic.lower()
-            for word in discipline_words:
-                if word in topic_lower:
-                    is_discipline_relevant = True
-                    score += 15.0  # Standard boost for topic match
-                    break
-            if is_discipline_relevant:
-                break
-
-    # Fallback: use static keywords for legacy disciplines
-    if not is_discipline_relevant and discipline in RELEVANT_TOPIC_KEYWORDS:
-        relevant_keywords = RELEVANT_TOPIC_KEYWORDS.get(discipline, [])
-        if any(k in journal_name_lower for k in relevant_keywords):
-            is_discipline_relevant = True
-            score += 15.0
-        else:
-            for topic in journal.topics:
-                if any(k in topic.lower() for k in relevant_keywords):
-                    is_discipline_relevant = True
-                    score += 15.0
-                    break
-
-    # 7. Core Journal Safety Net - DISABLED
-    # Was giving +100 to generic prestigious journals (NEJM, Lancet)
-    # causing them to rank above topic-relevant journals
-    # journal_name_norm = normalize_journal_name(journal.name)
-    # if journal_name_norm in core_journals:
-    #     score += 100.0
-
-    return score
+    return score_and_explain(
+        journal,
+        prepare_query(discipline, search_terms),
+        is_topic_match,
+        is_keyword_match,
+        explain=False,
+    ).score
@@ -6,18 +6,36 @@ Enhanced with multi-discipline detection, article type awareness, and topic vali
 
 Phase 4: Now uses SmartAnalyzer for orchestrated paper analysis.
 """
+import copy
+import hashlib
+import heapq
 import logging
+import threading
+import time
 from collections import Counter
-from typing import Dict, List, Optional, Tuple, Set
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, List, Optional, Tuple, Set
 
 from app.models.journal import Journal
 from .client import get_client
-from .config import get_min_journal_works
+from .config import (
+    get_max_concurrent_requests,
+    get_min_journal_works,
+    get_page2_skip_thresholds,
+    get_prefetch_works_page2,
+    get_secondary_discipline_min_confidence,
+    get_speculative_fallback_confidence,
+    get_text_search_cache_settings,
+)
 from .constants import load_core_journals
 from .utils import extract_search_terms
 from .scoring import (
-    calculate_relevance_score,
-    generate_match_details,
+    JournalText,
+    journal_text,
+    prepare_query,
+    score_and_explain,
     EnhancedJournalScorer,
     ScoringContext,
 )
@@ -25,8 +43,8 @@ from .journals import convert_to_journal, categorize_journals, merge_journal_res
 
 # Import analysis modules - using lazy imports for SmartAnalyzer to avoid circular imports
 from app.services.analysis import (
-    ArticleTypeDetector,
     TopicRelevanceValidator,
+    get_article_type_detector,
 )
 
 # TYPE_CHECKING for type hints without runtime import
@@ -36,6 +54,24 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Long-lived pool for speculative work that may outlive a single search stage.
+# Tasks running here must never submit to (and wait on) this same pool -
+# with every worker busy that deadlocks.
+_speculative_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="openalex-fallback"
+)
+
+# Page-2 works prefetch. Kept separate from _speculative_executor because
+# find_journals_from_works also runs inside run_fallback_search on that pool;
+# prefetch tasks are leaf fetches that never submit further work.
+_prefetch_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="openalex-prefetch"
+)
+
+# Results of search_journals_by_text keyed by input hash (see clear_text_search_cache())
+_text_search_cache: Dict[str, Tuple[float, tuple]] = {}
+_text_search_cache_lock = threading.Lock()
+
 
 def find_journals_from_works(
     search_query: str,
@@ -44,7 +80,14 @@ def find_journals_from_works(
     """
     Find journals by searching for papers on the topic.
 
-    Fetches up to 2 pages (400 works) for better coverage.
+    Fetches up to 2 pages (400 works) for better coverage. Page 2 is skipped
+    when page 1 already spans many journals and is dominated by its top 10,
+    since only the top candidates are kept downstream. This trades a little
+    long-tail coverage on highly concentrated topics for one less request.
+
+    By default page 2 is requested together with page 1 and simply dropped
+    when not needed, trading that saved request for one less round trip
+    (see OpenAlexConfig.PREFETCH_WORKS_PAGE2).
 
     Args:
         search_query: Combined search terms.
@@ -54,34 +97,62 @@ def find_journals_from_works(
         Dict of source_id -> source data with frequency count.
     """
     client = get_client()
-    journal_counts: Dict[str, dict] = {}
+    # Counts are tallied per page with Counter; the source dict and OA flag
+    # are kept from each journal's first work only
+    source_counts: Counter = Counter()
+    first_seen: Dict[str, Tuple[dict, bool]] = {}
 
     def process_works(works: List[dict]) -> None:
+        source_ids: List[str] = []
+        append_id = source_ids.append
         for work in works:
-            primary_location = work.get("primary_location", {})
-            source = primary_location.get("source") if primary_location else None
+            primary_location = work.get("primary_location") or {}
+            source = primary_location.get("source")
 
             if source and source.get("type") == "journal":
                 source_id = source.get("id", "")
                 if source_id:
-                    if source_id not in journal_counts:
-                        journal_counts[source_id] = {
-                            "source": source,
-                            "count": 0,
-                            "is_oa": primary_location.get("is_oa", False),
-                        }
-                    journal_counts[source_id]["count"] += 1
+                    append_id(source_id)
+                    if source_id not in first_seen:
+                        first_seen[source_id] = (source, primary_location.get("is_oa", False))
+        source_counts.update(source_ids)
+
+    # Only the source/OA info is read - skip the rest of each work
+    select = ["primary_location"]
+
+    def fetch_page(page: int) -> List[dict]:
+        return client.search_works(search_query, per_page=200, page=page, select=select)
+
+    page2_future = None
+    if get_prefetch_works_page2():
+        page2_future = _prefetch_executor.submit(fetch_page, 2)
 
     # Page 1
-    works_page1 = client.search_works(search_query, per_page=200, page=1)
+    works_page1 = fetch_page(1)
     process_works(works_page1)
 
-    # Page 2 if first was full
-    if len(works_page1) == 200:
-        works_page2 = client.search_works(search_query, per_page=200, page=2)
+    # Page 2 if first was full and its top journals aren't already clear
+    if len(works_page1) == 200 and not _is_source_ranking_saturated(source_counts):
+        works_page2 = page2_future.result() if page2_future else fetch_page(2)
         process_works(works_page2)
+    elif page2_future:
+        page2_future.cancel()
 
-    return journal_counts
+    return {
+        source_id: {"source": source, "count": source_counts[source_id], "is_oa": is_oa}
+        for source_id, (source, is_oa) in first_seen.items()
+    }
+
+
+def _is_source_ranking_saturated(source_counts: Dict[str, int]) -> bool:
+    """Check whether more works are unlikely to change the top journals."""
+    min_sources, min_concentration = get_page2_skip_thresholds()
+    if len(source_counts) < min_sources:
+        return False
+
+    counts = source_counts.values()
+    total = sum(counts)
+    return total > 0 and sum(heapq.nlargest(10, counts)) / total > min_concentration
 
 
 def get_topics_from_similar_works(search_query: str) -> Tuple[List[str], str, str, Optional[int], float]:
@@ -103,51 +174,57 @@ def get_topics_from_similar_works(search_query: str) -> Tuple[List[str], str, st
         - Confidence score (0-1) based on consensus among works
     """
     client = get_client()
-    topic_ids: Counter = Counter()
-    subfield_scores: Counter = Counter()  # Track by ID for accuracy
+    topic_ids: Dict[str, float] = {}
+    subfield_scores: Dict[int, float] = {}  # Track by ID for accuracy
     subfield_names: Dict[int, str] = {}   # Map ID -> display name
-    fields: Counter = Counter()
+    fields: Dict[str, float] = {}
     total_topic_score = 0.0
+    topic_ids_get = topic_ids.get
+    subfield_scores_get = subfield_scores.get
+    fields_get = fields.get
 
-    works = client.search_works(search_query, per_page=50)
+    works = client.search_works(search_query, per_page=50, select=["topics"])
     works_count = len(works)
 
     for work in works:
-        topics = work.get("topics") or []
-        for topic in topics:
+        for topic in work.get("topics") or ():
             topic_id = topic.get("id")
-            if topic_id:
-                # Weight by score if available
-                score = topic.get("score", 1.0)
-                topic_ids[topic_id] += score
-                total_topic_score += score
-
-                # Extract subfield and field from OpenAlex hierarchy
-                subfield = topic.get("subfield", {})
-                field = topic.get("field", {})
-
-                # Track subfield by ID (more accurate than name)
-                if subfield:
-                    sf_id = subfield.get("id")
-                    sf_name = subfield.get("display_name")
-                    if sf_id and sf_name:
-                        subfield_scores[sf_id] += score
-                        subfield_names[sf_id] = sf_name
-
-                if field and field.get("display_name"):
-                    fields[field["display_name"]] += score
-
-    top_topic_ids = [tid for tid, _ in topic_ids.most_common(5)]
+            if not topic_id:
+                continue
+
+            # Weight by score if available
+            score = topic.get("score", 1.0)
+            topic_ids[topic_id] = topic_ids_get(topic_id, 0.0) + score
+            total_topic_score += score
+
+            # Extract subfield and field from OpenAlex hierarchy
+            # Track subfield by ID (more accurate than name)
+            subfield = topic.get("subfield")
+            if subfield:
+                sf_id = subfield.get("id")
+                sf_name = subfield.get("display_name")
+                if sf_id and sf_name:
+                    subfield_scores[sf_id] = subfield_scores_get(sf_id, 0.0) + score
+                    subfield_names[sf_id] = sf_name
+
+            field = topic.get("field")
+            if field:
+                field_name = field.get("display_name")
+                if field_name:
+                    fields[field_name] = fields_get(field_name, 0.0) + score
+
+    top_topic_ids = heapq.nlargest(5, topic_ids, key=topic_ids_get)
 
     # Get top subfield by ID, then lookup name
     top_subfield_id: Optional[int] = None
     top_subfield = ""
     top_subfield_score = 0.0
     if subfield_scores:
-        top_subfield_id, top_subfield_score = subfield_scores.most_common(1)[0]
+        top_subfield_id = max(subfield_scores, key=subfield_scores_get)
+        top_subfield_score = subfield_scores[top_subfield_id]
         top_subfield = subfield_names.get(top_subfield_id, "")
 
-    top_field = fields.most_common(1)[0][0] if fields else ""
+    top_field = max(fields, key=fields_get) if fields else ""
 
     # Calculate confidence score (Story 2.1)
     # Based on: (1) how dominant the top subfield is, (2) number of works found
@@ -206,6 +283,22 @@ def find_journals_by_topics(topic_ids: List[str]) -> Dict[str, dict]:
     return journals
 
 
+# Search terms that usually name a specialized journal (e.g., "Infancy")
+_SPECIALIZED_TERMS: FrozenSet[str] = frozenset({
+    "infancy", "infant", "toddler", "child", "developmental",
+    "endocrine", "hormone", "diabetes", "metabolism",
+})
+
+
+@lru_cache(maxsize=256)
+def _subfield_query_words(subfield: str) -> Tuple[str, ...]:
+    """Extract significant lowercase words (len > 5) from a subfield name, in order."""
+    return tuple(
+        w.strip() for w in subfield.lower().replace(",", " ").split()
+        if len(w.strip()) > 5  # Only significant words
+    )
+
+
 def find_journals_by_subfield(
     subfield: str,
     search_terms: List[str] = None,
@@ -229,52 +322,44 @@ def find_journals_by_subfield(
     client = get_client()
     journals: Dict[str, dict] = {}
 
-    # Search for journals by subfield name
-    sources = client.search_sources(subfield, per_page=20)
-
-    for source in sources:
-        source_id = source.get("id", "")
-        if source_id:
-            journals[source_id] = {
-                "source": source,
-                "reason": f"Specialized journal for {subfield}",
-            }
-
     # Also search for key terms from the subfield
     # e.g., "Developmental and Educational Psychology" -> search "developmental", "psychology"
-    subfield_words = [
-        w.strip() for w in subfield.lower().replace(",", " ").split()
-        if len(w.strip()) > 5  # Only significant words
+    subfield_words = _subfield_query_words(subfield)
+
+    # Search for specialized journals based on key search terms
+    # This catches journals like "Infancy" for infant-related searches
+    specialized_terms: List[str] = []
+    if search_terms:
+        specialized_terms = [
+            t for t in search_terms if t.lower() in _SPECIALIZED_TERMS
+        ]
+
+    # Name searches are independent - issue them together, merge in order
+    # (first query to return a journal sets its reason)
+    queries = [(subfield, 20, f"Specialized journal for {subfield}")]
+    queries += [
+        (word, 10, f"Related to {subfield}")
+        for word in subfield_words[:2]  # Limit to 2 key terms
+    ]
+    queries += [
+        (term, 10, f"Specialized journal matching '{term}'")
+        for term in specialized_terms[:3]
     ]
 
-    for word in subfield_words[:2]:  # Limit to 2 key terms
-        sources = client.search_sources(word, per_page=10)
+    with ThreadPoolExecutor(max_workers=get_max_concurrent_requests()) as executor:
+        results = list(executor.map(
+            lambda q: client.search_sources(q[0], per_page=q[1]), queries
+        ))
+
+    for (_, _, reason), sources in zip(queries, results):
         for source in sources:
             source_id = source.get("id", "")
             if source_id and source_id not in journals:
                 journals[source_id] = {
                     "source": source,
-                    "reason": f"Related to {subfield}",
+                    "reason": reason,
                 }
 
-    # Search for specialized journals based on key search terms
-    # This catches journals like "Infancy" for infant-related searches
-    if search_terms:
-        specialized_terms = [
-            t for t in search_terms
-            if t.lower() in ["infancy", "infant", "toddler", "child", "developmental",
-                            "endocrine", "hormone", "diabetes", "metabolism"]
-        ]
-        for term in specialized_terms[:3]:
-            sources = client.search_sources(term, per_page=10)
-            for source in sources:
-                source_id = source.get("id", "")
-                if source_id and source_id not in journals:
-                    journals[source_id] = {
-                        "source": source,
-                        "reason": f"Specialized journal matching '{term}'",
-                    }
-
     return journals
 
 
@@ -313,7 +398,7 @@ def find_journals_by_subfield_id(subfield_id: Optional[int]) -> Dict[str, dict]:
 
 
 def is_journal_relevant_to_subfield(
-    journal: Journal, subfield: str, field: str
+    journal: Journal, subfield: str, field: str, text: Optional[JournalText] = None
 ) -> bool:
     """
     Check if a journal is relevant to the detected subfield/field.
@@ -325,6 +410,7 @@ def is_journal_relevant_to_subfield(
         journal: Journal to check.
         subfield: Detected OpenAlex subfield.
         field: Detected OpenAlex field.
+        text: Precomputed journal_text() for the journal (built if omitted).
 
     Returns:
         True if journal is relevant, False otherwise.
@@ -332,54 +418,62 @@ def is_journal_relevant_to_subfield(
     if not subfield and not field:
         return True  # No filter if no subfield detected
 
-    journal_name_lower = journal.name.lower()
-    journal_topics_lower = [t.lower() for t in journal.topics]
+    if text is None:
+        text = journal_text(journal)
+    return _matches_discipline_words(
+        text.name_lower, text.topics_blob, _discipline_words(subfield, field)
+    )
+
+
+# Common related terms in psychology/development
+_RELATED_TERMS: Dict[str, Tuple[str, ...]] = {
+    "developmental": ("child", "infant", "adolescent", "pediatric", "youth"),
+    "psychology": ("psychological", "cogniti", "behavior", "mental", "emotion"),
+    "educational": ("education", "learning", "school", "teaching"),
+}
+
 
-    # Extract keywords from subfield/field
+@lru_cache(maxsize=256)
+def _discipline_words(subfield: str, field: str) -> FrozenSet[str]:
+    """Extract lowercase keywords (len > 3) from a subfield/field pair."""
     subfield_words = set()
-    if subfield:
-        subfield_words.update(
-            w.strip() for w in subfield.lower().replace(",", " ").split()
-            if len(w.strip()) > 3
-        )
-    if field:
-        subfield_words.update(
-            w.strip() for w in field.lower().replace(",", " ").split()
-            if len(w.strip()) > 3
-        )
+    for name in (subfield, field):
+        if name:
+            subfield_words.update(
+                w.strip() for w in name.lower().replace(",", " ").split()
+                if len(w.strip()) > 3
+            )
+    return frozenset(subfield_words)
+
 
-    # Check if journal name contains any subfield/field words
+def _matches_discipline_words(
+    journal_name_lower: str, topics_blob: str, subfield_words: FrozenSet[str]
+) -> bool:
+    """
+    Check a journal's lowercase name and topics against discipline words.
+
+    topics_blob is the lowercase topics joined by newlines, so one substring
+    test covers every topic (words never contain newlines).
+    """
+    # Check if journal name or topics contain any subfield/field words
     for word in subfield_words:
-        if word in journal_name_lower:
+        if word in journal_name_lower or word in topics_blob:
             return True
 
-    # Check if journal topics contain any subfield/field words
-    for topic in journal_topics_lower:
-        for word in subfield_words:
-            if word in topic:
-                return True
-
     # Also check for common related terms in psychology/development
-    related_terms = {
-        "developmental": ["child", "infant", "adolescent", "pediatric", "youth"],
-        "psychology": ["psychological", "cogniti", "behavior", "mental", "emotion"],
-        "educational": ["education", "learning", "school", "teaching"],
-    }
-
-    for base_word, related in related_terms.items():
+    for base_word, related in _RELATED_TERMS.items():
         if base_word in subfield_words:
             for rel_term in related:
-                if rel_term in journal_name_lower:
+                if rel_term in journal_name_lower or rel_term in topics_blob:
                     return True
-                for topic in journal_topics_lower:
-                    if rel_term in topic:
-                        return True
 
     return False
 
 
 def is_journal_relevant_to_any_discipline(
-    journal: Journal, detected_disciplines: List[dict]
+    journal: Journal,
+    detected_disciplines: List[dict],
+    text: Optional[JournalText] = None,
 ) -> bool:
     """
     Check if a journal is relevant to ANY of the detected disciplines.
@@ -390,6 +484,7 @@ def is_journal_relevant_to_any_discipline(
     Args:
         journal: Journal to check.
         detected_disciplines: List of detected discipline dicts with subfield/field info.
+        text: Precomputed journal_text() for the journal (built if omitted).
 
     Returns:
         True if journal is relevant to any discipline, False otherwise.
@@ -397,6 +492,12 @@ def is_journal_relevant_to_any_discipline(
     if not detected_disciplines:
         return True  # No filter if no disciplines detected
 
+    # Lowercase the journal once for all disciplines
+    if text is None:
+        text = journal_text(journal)
+    journal_name_lower = text.name_lower
+    topics_blob = text.topics_blob
+
     # Check against each detected discipline using OpenAlex subfield/field directly
     for disc in detected_disciplines:
         # Get subfield and field from the discipline dict (from OpenAlex)
@@ -404,12 +505,71 @@ def is_journal_relevant_to_any_discipline(
         field = disc.get("field", "")    # OpenAlex field name
 
         # If journal is relevant to this discipline, keep it
-        if is_journal_relevant_to_subfield(journal, subfield, field):
+        if not subfield and not field:
+            return True  # No filter if no subfield detected
+        if _matches_discipline_words(
+            journal_name_lower, topics_blob, _discipline_words(subfield, field)
+        ):
             return True
 
     return False
 
 
+def _select_secondary_disciplines(
+    secondary: List[dict],
+    primary_subfield: str,
+    primary_field: str,
+    primary_subfield_id: Optional[int],
+) -> List[dict]:
+    """
+    Drop secondary disciplines whose subfield search would add little.
+
+    Skips repeats of the primary (or an earlier secondary) subfield, and
+    low-confidence secondaries in the primary's field, whose journals the
+    primary search and topic search largely cover already.
+
+    Args:
+        secondary: Secondary discipline dicts, in priority order.
+        primary_subfield: Primary subfield name.
+        primary_field: Primary field name.
+        primary_subfield_id: Primary numeric subfield ID, if known.
+
+    Returns:
+        Secondary disciplines worth a separate subfield search.
+    """
+    min_confidence = get_secondary_discipline_min_confidence()
+    # Numeric subfield IDs or lowercase subfield names already searched
+    seen: Set = set()
+    if primary_subfield:
+        seen.add(primary_subfield.lower())
+    if primary_subfield_id:
+        seen.add(primary_subfield_id)
+    selected: List[dict] = []
+
+    for disc in secondary:
+        numeric_id = disc.get("numeric_id") or disc.get("openalex_subfield_id")
+        key = numeric_id if isinstance(numeric_id, int) else disc.get("name", "").lower()
+        if key in seen:
+            continue
+        seen.add(key)
+
+        if (
+            primary_field
+            and disc.get("field") == primary_field
+            and disc.get("confidence", 0) < min_confidence
+        ):
+            continue
+        selected.append(disc)
+
+    return selected
+
+
+@lru_cache(maxsize=512)
+def _paper_count_reason(count: int) -> str:
+    """Match reason for journals found via works search (shared per count)."""
+    return f"Published {count} papers on this topic"
+
+
 def search_journals_by_keywords(
     keywords: List[str],
     prefer_open_access: bool = False,
@@ -427,7 +587,8 @@ def search_journals_by_keywords(
         prefer_open_access: Prioritize OA journals.
         min_works_count: Minimum number of works.
         discipline: Detected discipline for filtering.
-        core_journals: Set of core journal names for boosting.
+        core_journals: Set of core journal names for boosting. Unused while
+            the core journal boost is disabled.
 
     Returns:
         List of matching journals.
@@ -435,19 +596,25 @@ def search_journals_by_keywords(
     if not keywords:
         return []
 
-    if core_journals is None:
-        core_journals = load_core_journals()
-
     client = get_client()
     min_works = min_works_count or get_min_journal_works()
-    all_journals: Dict[str, Journal] = {}
+    seen_ids: Set[str] = set()
+    # (sort key, journal) pairs - keys are built once while scoring
+    ranked: List[Tuple[tuple, Journal]] = []
+    score_query = prepare_query(discipline, keywords)
 
-    # 1. WORKS Search (papers that match the topic)
     search_query = " ".join(keywords[:5])
-    journal_data = find_journals_from_works(search_query, prefer_open_access)
 
-    # 2. DIRECT SOURCES Search (journals with matching names)
-    direct_sources = client.search_sources(search_query)
+    with ThreadPoolExecutor(max_workers=get_max_concurrent_requests()) as executor:
+        # 1. WORKS Search (papers that match the topic)
+        # 2. DIRECT SOURCES Search (journals with matching names)
+        # Independent requests - run them concurrently
+        works_future = executor.submit(
+            find_journals_from_works, search_query, prefer_open_access
+        )
+        direct_sources = client.search_sources(search_query)
+        journal_data = works_future.result()
+
     for source in direct_sources:
         source_id = source.get("id", "")
         if source_id and source_id not in journal_data:
@@ -458,16 +625,24 @@ def search_journals_by_keywords(
             }
 
     # Sort by frequency and get details for top 50 candidates
-    sorted_sources = sorted(
-        journal_data.items(), key=lambda x: x[1]["count"], reverse=True
-    )[:50]
+    sorted_sources = heapq.nlargest(
+        50, journal_data.items(), key=lambda x: x[1]["count"]
+    )
+
+    # Fetch full details for candidates missing works_count in one batch
+    missing_ids = [
+        source_id for source_id, data in sorted_sources
+        if not data.get("source") or "works_count" not in data["source"]
+    ]
+    fetched_sources = client.get_sources_by_ids(missing_ids) if missing_ids else {}
 
     for source_id, data in sorted_sources:
         full_source = data.get("source")
         if not full_source or "works_count" not in full_source:
-            full_source = client.get_source_by_id(source_id)
+            full_source = fetched_sources.get(source_id)
 
-        if not full_source:
+        # Skip duplicates before building the Journal (its id is the source id)
+        if not full_source or full_source.get("id", "") in seen_ids:
             continue
 
         works_count = full_source.get("works_count", 0)
@@ -475,42 +650,41 @@ def search_journals_by_keywords(
             continue
 
         journal = convert_to_journal(full_source)
-        if not journal or journal.id in all_journals:
+        if not journal:
             continue
 
         # Calculate initial relevance score
-        score = calculate_relevance_score(
-            journal=journal,
-            discipline=discipline,
+        score = score_and_explain(
+            journal,
+            score_query,
             is_topic_match=False,
             is_keyword_match=True,
-            search_terms=keywords,
-            core_journals=core_journals,
-        )
+            explain=False,
+        ).score
 
         # Match reason
         if data["count"] > 0:
-            journal.match_reason = f"Published {data['count']} papers on this topic"
+            journal.match_reason = _paper_count_reason(data["count"])
         else:
             journal.match_reason = "Direct name match"
 
         # Add small boost for paper count to break ties
         journal.relevance_score = score + (data["count"] / 100.0)
-        all_journals[journal.id] = journal
-
-    # Sort by relevance_score and quality metrics
-    journals = sorted(
-        all_journals.values(),
-        key=lambda j: (
-            j.is_oa if prefer_open_access else False,
-            j.relevance_score,
-            1 if "papers on this topic" in (j.match_reason or "") else 0,
-            j.metrics.h_index or 0,
-        ),
-        reverse=True,
-    )
+        seen_ids.add(journal.id)
 
-    return journals[:15]  # Return more candidates for hybrid merge
+        # Sort by relevance_score and quality metrics (papers on topic first)
+        ranked.append((
+            (
+                journal.is_oa if prefer_open_access else False,
+                journal.relevance_score,
+                1 if data["count"] > 0 else 0,
+                journal.metrics.h_index or 0,
+            ),
+            journal,
+        ))
+
+    # Return more candidates for hybrid merge
+    return [journal for _, journal in heapq.nlargest(15, ranked, key=itemgetter(0))]
 
 
 def search_journals_by_text(
@@ -526,6 +700,11 @@ def search_journals_by_text(
     Uses HYBRID approach: Keywords + Topics.
     Enhanced with SmartAnalyzer for orchestrated paper analysis.
 
+    Results are cached by input for a short TTL, so re-running the same
+    query (pagination, refinement) skips the whole pipeline. Empty results
+    and runs where an OpenAlex request failed are not cached. Callers get
+    their own copy and may mutate it freely.
+
     Args:
         title: Article title.
         abstract: Article abstract.
@@ -543,6 +722,77 @@ def search_journals_by_text(
         - article_type: Detected article type info
         - analysis_metadata: SmartAnalyzer metadata (NEW)
     """
+    key = _text_search_cache_key(title, abstract, keywords, prefer_open_access, enable_llm)
+    ttl, max_entries = get_text_search_cache_settings()
+
+    with _text_search_cache_lock:
+        entry = _text_search_cache.pop(key, None)
+        if entry is not None and time.time() - entry[0] < ttl:
+            # Re-insert to keep the most recently used entries last
+            _text_search_cache[key] = entry
+            cached = entry[1]
+        else:
+            cached = None
+
+    if cached is not None:
+        logger.debug(f"Text search cache hit: {key[:12]}")
+        return copy.deepcopy(cached)
+    logger.debug(f"Text search cache miss: {key[:12]}")
+
+    client = get_client()
+    failures_before = client.failure_count
+    result = _search_journals_by_text(
+        title, abstract, keywords, prefer_open_access, enable_llm
+    )
+
+    # Don't pin empty or degraded results (an OpenAlex call failed) for the TTL
+    if not result[0] or client.failure_count != failures_before:
+        logger.debug(f"Text search result not cached: {key[:12]}")
+        return result
+
+    stored = copy.deepcopy(result)
+    with _text_search_cache_lock:
+        _text_search_cache.pop(key, None)
+        while len(_text_search_cache) >= max_entries:
+            del _text_search_cache[next(iter(_text_search_cache))]
+        _text_search_cache[key] = (time.time(), stored)
+
+    return result
+
+
+def _text_search_cache_key(
+    title: str,
+    abstract: str,
+    keywords: Optional[List[str]],
+    prefer_open_access: bool,
+    enable_llm: bool,
+) -> str:
+    """Hash the search inputs into a compact cache key."""
+    # NUL separator so fields can't run into each other ("a|b", "c" vs "a", "b|c")
+    raw = "\0".join((
+        title,
+        abstract,
+        repr(tuple(keywords or ())),
+        str(prefer_open_access),
+        str(enable_llm),
+    ))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def clear_text_search_cache() -> None:
+    """Clear cached search_journals_by_text results."""
+    with _text_search_cache_lock:
+        _text_search_cache.clear()
+
+
+def _search_journals_by_text(
+    title: str,
+    abstract: str,
+    keywords: Optional[List[str]],
+    prefer_open_access: bool,
+    enable_llm: bool,
+) -> Tuple[List[Journal], str, str, float, List[Dict], Optional[Dict], Optional[Dict]]:
+    """Run the uncached search_journals_by_text pipeline."""
     core_journals = load_core_journals()
 
     # === SMART ANALYSIS (Phase 4) ===
@@ -570,9 +820,6 @@ def search_journals_by_text(
     # Get topic IDs for journal search
     topic_ids = analysis_result.topic_ids
 
-    # 1. TOPIC-BASED SEARCH using SmartAnalyzer's topic IDs
-    topic_journals = find_journals_by_topics(topic_ids)
-
     # Get subfield_id from disciplines if available
     subfield_id: Optional[int] = None
     if analysis_result.disciplines:
@@ -605,7 +852,7 @@ def search_journals_by_text(
         logger.warning("No disciplines detected from SmartAnalyzer")
 
     # 3. ARTICLE TYPE DETECTION
-    article_type_detector = ArticleTypeDetector()
+    article_type_detector = get_article_type_detector()
     detected_article_type = article_type_detector.detect(abstract, title)
     article_type_dict = article_type_detector.to_dict(detected_article_type)
 
@@ -621,42 +868,85 @@ def search_journals_by_text(
     else:
         discipline = "general"  # Fallback when OpenAlex detection fails
 
-    # 4. SUBFIELD-BASED SEARCH - Find specialized journals
-    # Search for ALL detected disciplines (not just primary)
-    if subfield_id:
-        subfield_journals = find_journals_by_subfield_id(subfield_id)
-    else:
-        subfield_journals = find_journals_by_subfield(subfield, search_terms)
+    # Fallback search (used when <3 journals survive filtering). When no topics
+    # were found or detection is uncertain it is likely needed, so start it now
+    # and hide its latency behind the main searches.
+    def run_fallback_search() -> List[Journal]:
+        return search_journals_by_keywords(
+            search_terms[:2],
+            prefer_open_access=prefer_open_access,
+            discipline="general",
+            core_journals=core_journals,
+        )
 
-    # Also search for secondary disciplines using numeric IDs for accurate filtering
-    for disc in detected_disciplines_dicts[1:5]:  # Top 4 secondary disciplines (expand coverage)
-        # Use numeric ID if available (more accurate), fall back to name search
-        numeric_id = disc.get("numeric_id") or disc.get("openalex_subfield_id")
-        subfield_name = disc.get("name", "")
+    fallback_future = None
+    if not topic_ids or confidence < get_speculative_fallback_confidence():
+        fallback_future = _speculative_executor.submit(run_fallback_search)
 
-        if numeric_id and isinstance(numeric_id, int):
-            secondary_journals = find_journals_by_subfield_id(numeric_id)
-        elif subfield_name:
-            secondary_journals = find_journals_by_subfield(subfield_name, search_terms)
-        else:
-            continue
+    # The topic, subfield and keyword searches below are independent OpenAlex
+    # round trips - issue them concurrently, then merge in the original order.
+    with ThreadPoolExecutor(max_workers=get_max_concurrent_requests()) as executor:
+        # 1. TOPIC-BASED SEARCH using SmartAnalyzer's topic IDs
+        topic_future = executor.submit(find_journals_by_topics, topic_ids)
 
-        for source_id, data in secondary_journals.items():
-            if source_id not in subfield_journals:
-                subfield_journals[source_id] = data
+        # 4. SUBFIELD-BASED SEARCH - Find specialized journals
+        # Search for ALL detected disciplines (not just primary)
+        if subfield_id:
+            subfield_future = executor.submit(find_journals_by_subfield_id, subfield_id)
+        else:
+            subfield_future = executor.submit(find_journals_by_subfield, subfield, search_terms)
+
+        # Also search for secondary disciplines using numeric IDs for accurate filtering
+        secondary_futures = []
+        secondary_disciplines = _select_secondary_disciplines(
+            detected_disciplines_dicts[1:5],  # Top 4 secondary disciplines (expand coverage)
+            subfield,
+            field,
+            subfield_id,
+        )
+        for disc in secondary_disciplines:
+            # Use numeric ID if available (more accurate), fall back to name search
+            numeric_id = disc.get("numeric_id") or disc.get("openalex_subfield_id")
+            subfield_name = disc.get("name", "")
+
+            if numeric_id and isinstance(numeric_id, int):
+                secondary_futures.append(
+                    executor.submit(find_journals_by_subfield_id, numeric_id)
+                )
+            elif subfield_name:
+                secondary_futures.append(
+                    executor.submit(find_journals_by_subfield, subfield_name, search_terms)
+                )
+
+        # 5. KEYWORD-BASED SEARCH
+        keyword_future = executor.submit(
+            search_journals_by_keywords,
+            search_terms,
+            prefer_open_access=prefer_open_access,
+            discipline=discipline,
+            core_journals=core_journals,
+        )
 
-    # Merge subfield journals into topic_journals
-    for source_id, data in subfield_journals.items():
-        if source_id not in topic_journals:
-            topic_journals[source_id] = data
+        topic_journals = topic_future.result()
+        subfield_journals = subfield_future.result()
+        # Earlier results win on conflict; new ids are appended in order
+        # (filtered with a comprehension, then added in one C-level update)
+        for future in secondary_futures:
+            secondary_journals = future.result()
+            subfield_journals.update({
+                source_id: data
+                for source_id, data in secondary_journals.items()
+                if source_id not in subfield_journals
+            })
+        keyword_journals_list = keyword_future.result()
+
+    # Merge subfield journals into topic_journals (topic data wins)
+    topic_journals.update({
+        source_id: data
+        for source_id, data in subfield_journals.items()
+        if source_id not in topic_journals
+    })
 
-    # 5. KEYWORD-BASED SEARCH
-    keyword_journals_list = search_journals_by_keywords(
-        search_terms,
-        prefer_open_access=prefer_open_access,
-        discipline=discipline,
-        core_journals=core_journals,
-    )
     keyword_journals: Dict[str, Journal] = {j.id: j for j in keyword_journals_list}
 
     # 6. MERGE RESULTS - journals in both lists get boosted
@@ -674,13 +964,16 @@ def search_journals_by_text(
     # Categorize journals
     categorized = categorize_journals(merged_journals)
 
+    # Lowercase each candidate once; reused by filtering, scoring and validation
+    texts: Dict[str, JournalText] = {j.id: journal_text(j) for j in categorized}
+
     # 7. FILTER IRRELEVANT JOURNALS
     # CHANGED: Check relevance to ANY detected discipline (not just primary)
     # This allows secondary disciplines like Gynecology to contribute journals
     if detected_disciplines_dicts:
         filtered = [
             j for j in categorized
-            if is_journal_relevant_to_any_discipline(j, detected_disciplines_dicts)
+            if is_journal_relevant_to_any_discipline(j, detected_disciplines_dicts, texts[j.id])
         ]
         if len(filtered) >= 3:
             categorized = filtered
@@ -688,7 +981,7 @@ def search_journals_by_text(
         # Fallback to single discipline check if no multi-discipline detected
         filtered = [
             j for j in categorized
-            if is_journal_relevant_to_subfield(j, subfield, field)
+            if is_journal_relevant_to_subfield(j, subfield, field, texts[j.id])
         ]
         if len(filtered) >= 3:
             categorized = filtered
@@ -709,48 +1002,69 @@ def search_journals_by_text(
     # Identify sources for score recalculation
     keyword_ids = set(keyword_journals.keys())
     topic_id_set = set(topic_journals.keys())
+    match_query = prepare_query(discipline, search_terms)
+
+    # Use enhanced scorer with multi-discipline awareness (one batch per context)
+    enhanced_scores = enhanced_scorer.score_journals(
+        categorized,
+        scoring_context,
+        topic_match_ids=topic_id_set,
+        keyword_match_ids=keyword_ids,
+        search_terms=search_terms,
+        texts=[texts[j.id] for j in categorized],
+    )
 
-    # Recalculate scores with Enhanced Scoring
-    for journal in categorized:
-        is_keyword = journal.id in keyword_ids
-        is_topic = journal.id in topic_id_set
+    # Topic validation warnings (NEW)
+    topic_validator = TopicRelevanceValidator()
+    validation_context = topic_validator.prepare(detected_disciplines_dicts, keywords or [])
 
+    # Score every candidate and build its sort key
+    ranked: List[Tuple[tuple, Journal]] = []
+    max_score = 0.0
+    for journal, enhanced_score in zip(categorized, enhanced_scores):
         # Preserve existing merge bonus
         merge_bonus = journal.relevance_score if journal.relevance_score else 0
 
-        # Use enhanced scorer with multi-discipline awareness
-        journal.relevance_score = enhanced_scorer.score_journal(
-            journal=journal,
-            context=scoring_context,
-            is_topic_match=is_topic,
-            is_keyword_match=is_keyword,
-            search_terms=search_terms,
-        ) + (merge_bonus * 10)  # Amplify merge bonus
-
-        # Generate match details (Story 1.1 - Why it's a good fit)
-        details, matched = generate_match_details(
-            journal=journal,
-            discipline=discipline,
-            is_topic_match=is_topic,
-            is_keyword_match=is_keyword,
-            search_terms=search_terms,
-        )
-        journal.match_details = details
-        journal.matched_topics = matched
-
-    # === TOPIC VALIDATION ===
+        score = enhanced_score + (merge_bonus * 10)  # Amplify merge bonus
+        journal.relevance_score = score
+        if score > max_score:
+            max_score = score
+
+        # Final sort: prioritize by Weighted relevance_score
+        ranked.append((
+            (
+                journal.is_oa if prefer_open_access else False,
+                score,
+                journal.metrics.h_index or 0,
+            ),
+            journal,
+        ))
+
+    # Only the top 15 are returned - select them without sorting the rest
+    categorized = [
+        journal for _, journal in heapq.nlargest(15, ranked, key=itemgetter(0))
+    ]
 
-    # Add topic validation warnings (NEW)
-    topic_validator = TopicRelevanceValidator()
+    # Explanations and validation notes don't affect ranking - build them
+    # for the returned journals only
     for journal in categorized:
-        # Convert journal to dict format for validator
-        journal_dict = {
-            "topics": [{"display_name": t} for t in journal.topics],
-        }
+        is_keyword = journal.id in keyword_ids
+        is_topic = journal.id in topic_id_set
+
+        # Generate match details (Story 1.1 - Why it's a good fit)
+        text = texts[journal.id]
+        explained = score_and_explain(journal, match_query, is_topic, is_keyword, text=text)
+        journal.match_details = explained.details
+        journal.matched_topics = explained.matched_topics
+
+        # === TOPIC VALIDATION ===
+        # Validator accepts plain topic names (already lowercase here)
+        journal_dict = {"topics": text.topics_lower}
         validation = topic_validator.validate_journal_topics(
             journal_dict,
             detected_disciplines_dicts,
             keywords or [],
+            validation_context,
         )
         # Store validation warning if present
         if validation.get("warning"):
@@ -758,36 +1072,24 @@ def search_journals_by_text(
                 journal.match_details = []
             journal.match_details.append(f"Note: {validation['warning']}")
 
-    # Final sort: prioritize by Weighted relevance_score
-    categorized.sort(
-        key=lambda j: (
-            j.is_oa if prefer_open_access else False,
-            j.relevance_score,
-            j.metrics.h_index or 0,
-        ),
-        reverse=True,
-    )
-
     # Normalize relevance_score to 0-1 range for frontend display
-    if categorized:
-        max_score = max(j.relevance_score for j in categorized)
-        if max_score > 0:
-            for journal in categorized:
-                journal.relevance_score = journal.relevance_score / max_score
+    if max_score > 0:
+        for journal in categorized:
+            journal.relevance_score = journal.relevance_score / max_score
 
     # Fallback: ONLY add more if <3 results
     if len(categorized) < 3:
-        fallback_journals = search_journals_by_keywords(
-            search_terms[:2],
-            prefer_open_access=prefer_open_access,
-            discipline="general",
-            core_journals=core_journals,
-        )
+        if fallback_future is not None:
+            fallback_journals = fallback_future.result()
+        else:
+            fallback_journals = run_fallback_search()
         existing_ids = {j.id for j in categorized}
         for j in fallback_journals:
             if j.id not in existing_ids and len(categorized) < 7:
                 j.match_reason = "Broader search result"
                 categorized.append(j)
+    elif fallback_future is not None:
+        fallback_future.cancel()  # No-op if already running; its lookups stay cached
 
     # Build analysis metadata from SmartAnalyzer result
     analysis_metadata: Optional[Dict] = None
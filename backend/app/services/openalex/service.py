@@ -5,7 +5,7 @@ Maintains backward compatibility with existing code.
 This class wraps the modular functions for users who prefer
 the object-oriented interface.
 """
-from typing import List, Optional, Set, Tuple, Dict
+from typing import List, Optional, FrozenSet, Tuple, Dict
 
 from app.models.journal import Journal
 from .constants import load_core_journals
@@ -30,7 +30,7 @@ class OpenAlexService:
     def __init__(self):
         self.max_results = 25
         self.min_journal_works = 500
-        self.core_journals: Set[str] = load_core_journals()
+        self.core_journals: FrozenSet[str] = load_core_journals()
 
     def search_journals_by_keywords(
         self,
@@ -102,5 +102,21 @@ class OpenAlexService:
         )
 
 
-# Global instance for backward compatibility
-openalex_service = OpenAlexService()
+# Global instance for backward compatibility, created on first use so that
+# importing this module does not load the core journals list
+_openalex_service: Optional[OpenAlexService] = None
+
+
+def get_openalex_service() -> OpenAlexService:
+    """Get or create global OpenAlex service instance."""
+    global _openalex_service
+    if _openalex_service is None:
+        _openalex_service = OpenAlexService()
+    return _openalex_service
+
+
+def __getattr__(name: str):
+    # Keeps `from .service import openalex_service` working (PEP 562)
+    if name == "openalex_service":
+        return get_openalex_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
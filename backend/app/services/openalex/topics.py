@@ -12,9 +12,10 @@ The Topics API provides:
 import logging
 from collections import Counter
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
-from .client import get_client
+from .client import ANALYSIS_WORK_SELECT_FIELDS, get_client
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +65,16 @@ class TopicsAnalysisResult:
     total_topics_found: int = 0
 
 
+@lru_cache(maxsize=1024)
+def _parse_numeric_id(openalex_url: str) -> Optional[int]:
+    """Parse the trailing numeric ID of an OpenAlex URL (hierarchy URLs repeat per topic)."""
+    try:
+        # Handle both full URL and short form
+        return int(openalex_url.rstrip("/").rpartition("/")[2])
+    except ValueError:
+        return None
+
+
 class TopicsService:
     """
     Service for working with OpenAlex Topics API.
@@ -99,14 +110,18 @@ class TopicsService:
         """
         result = TopicsAnalysisResult()
 
-        # Track scores by subfield ID for accuracy
+        # Track scores by subfield ID for accuracy. Per-subfield values live in
+        # parallel dicts keyed by ID (no nested dict per subfield)
         subfield_scores: Counter = Counter()
-        subfield_data: Dict[int, Dict] = {}  # ID -> metadata
+        subfield_work_counts: Counter = Counter()
+        subfield_meta: Dict[int, Tuple[str, str, Optional[str]]] = {}  # ID -> (name, field, domain)
         topic_ids: Counter = Counter()
         total_score = 0.0
 
         # Search for similar works
-        works = self.client.search_works(search_query, per_page=max_works)
+        works = self.client.search_works(
+            search_query, per_page=max_works, select=ANALYSIS_WORK_SELECT_FIELDS
+        )
         result.works_analyzed = len(works)
 
         if not works:
@@ -129,8 +144,6 @@ class TopicsService:
 
                 # Extract hierarchy
                 subfield = topic.get("subfield", {})
-                field_data = topic.get("field", {})
-                domain = topic.get("domain", {})
 
                 if subfield:
                     sf_id = self._extract_id(subfield.get("id"))
@@ -138,38 +151,35 @@ class TopicsService:
 
                     if sf_id and sf_name:
                         subfield_scores[sf_id] += score
+                        subfield_work_counts[sf_id] += 1
 
-                        # Store metadata for later
-                        if sf_id not in subfield_data:
-                            subfield_data[sf_id] = {
-                                "name": sf_name,
-                                "field": field_data.get("display_name", ""),
-                                "domain": domain.get("display_name"),
-                                "work_count": 0,
-                            }
-                        subfield_data[sf_id]["work_count"] += 1
+                        # Store metadata for later (field/domain read on first sight only)
+                        if sf_id not in subfield_meta:
+                            subfield_meta[sf_id] = (
+                                sf_name,
+                                topic.get("field", {}).get("display_name", ""),
+                                topic.get("domain", {}).get("display_name"),
+                            )
 
         # Convert to DetectedSubfield objects
         all_subfields: List[DetectedSubfield] = []
         for sf_id, score in subfield_scores.most_common(10):
-            if sf_id not in subfield_data:
-                continue
-
-            data = subfield_data[sf_id]
+            name, field_name, domain_name = subfield_meta[sf_id]
             confidence = score / total_score if total_score > 0 else 0
 
-            # Apply minimum threshold
+            # Apply minimum threshold; most_common is sorted by score, so
+            # every remaining subfield is below it too
             if confidence < min_confidence:
-                continue
+                break
 
             detected = DetectedSubfield(
                 subfield_id=sf_id,
-                subfield_name=data["name"],
-                field_name=data["field"],
-                domain_name=data["domain"],
+                subfield_name=name,
+                field_name=field_name,
+                domain_name=domain_name,
                 score=score,
                 confidence=confidence,
-                work_count=data["work_count"],
+                work_count=subfield_work_counts[sf_id],
             )
             all_subfields.append(detected)
 
@@ -190,8 +200,8 @@ class TopicsService:
         """
         Get full hierarchy for a topic ID.
 
-        Note: OpenAlex Topics API doesn't have a direct endpoint for this.
-        We extract hierarchy from works that have this topic.
+        Uses the Topics endpoint, whose records carry the domain, field and
+        subfield directly.
 
         Args:
             topic_id: OpenAlex topic ID (full URL or short form).
@@ -203,42 +213,71 @@ class TopicsService:
         if not topic_id.startswith("https://"):
             topic_id = f"https://openalex.org/{topic_id}"
 
-        # Search for a work with this topic
         try:
             import pyalex
-            works = (
-                pyalex.Works()
-                .filter(topics={"id": topic_id})
-                .get(per_page=1)
-            )
+            topic = pyalex.Topics()[topic_id.rpartition("/")[2]]
 
-            if not works:
+            if not topic:
                 return None
 
-            # Extract hierarchy from first work
-            for topic in works[0].get("topics", []):
-                if topic.get("id") == topic_id:
-                    subfield = topic.get("subfield", {})
-                    field_data = topic.get("field", {})
-                    domain = topic.get("domain", {})
-
-                    return TopicHierarchy(
-                        domain_id=domain.get("id"),
-                        domain_name=domain.get("display_name"),
-                        field_id=field_data.get("id"),
-                        field_name=field_data.get("display_name"),
-                        subfield_id=self._extract_id(subfield.get("id")),
-                        subfield_name=subfield.get("display_name"),
-                        topic_id=topic_id,
-                        topic_name=topic.get("display_name"),
-                    )
-
-            return None
+            return self._hierarchy_from_topic(topic, topic_id)
 
         except Exception as e:
             logger.error(f"Error getting topic hierarchy for {topic_id}: {e}")
+            self.client.record_failure()
             return None
 
+    def get_topic_hierarchies(self, topic_ids: List[str]) -> Dict[str, TopicHierarchy]:
+        """
+        Get hierarchies for several topic IDs in one request.
+
+        Args:
+            topic_ids: OpenAlex topic IDs (full URL or short form, max 50).
+
+        Returns:
+            Dict of full topic URL -> TopicHierarchy for the topics found.
+        """
+        short_ids = [tid.rpartition("/")[2] for tid in topic_ids[:50]]
+        if not short_ids:
+            return {}
+
+        try:
+            import pyalex
+            topics = (
+                pyalex.Topics()
+                .filter(openalex_id="|".join(short_ids))
+                .get(per_page=len(short_ids))
+            )
+
+            hierarchies: Dict[str, TopicHierarchy] = {}
+            for topic in topics:
+                tid = topic.get("id")
+                if tid:
+                    hierarchies[tid] = self._hierarchy_from_topic(topic, tid)
+            return hierarchies
+
+        except Exception as e:
+            logger.error(f"Error getting topic hierarchies: {e}")
+            self.client.record_failure()
+            return {}
+
+    def _hierarchy_from_topic(self, topic: dict, topic_id: str) -> TopicHierarchy:
+        """Build a TopicHierarchy from an OpenAlex topic record."""
+        subfield = topic.get("subfield") or {}
+        field_data = topic.get("field") or {}
+        domain = topic.get("domain") or {}
+
+        return TopicHierarchy(
+            domain_id=domain.get("id"),
+            domain_name=domain.get("display_name"),
+            field_id=field_data.get("id"),
+            field_name=field_data.get("display_name"),
+            subfield_id=self._extract_id(subfield.get("id")),
+            subfield_name=subfield.get("display_name"),
+            topic_id=topic_id,
+            topic_name=topic.get("display_name"),
+        )
+
     def find_related_topics(
         self,
         topic_ids: List[str],
@@ -247,7 +286,9 @@ class TopicsService:
         """
         Find topics related to the given topic IDs.
 
-        Uses co-occurrence in works to find related topics.
+        Uses co-occurrence in works to find related topics. The counts are
+        aggregated server-side with ``group_by`` so only the histogram is
+        downloaded, not the works themselves.
 
         Args:
             topic_ids: List of topic IDs to find relations for.
@@ -259,30 +300,31 @@ class TopicsService:
         if not topic_ids:
             return []
 
-        related: Counter = Counter()
-
         # Search for works with these topics
         try:
             import pyalex
-            works = (
+            groups = (
                 pyalex.Works()
                 .filter(topics={"id": topic_ids[:5]})  # Limit to avoid long query
-                .get(per_page=30)
+                .group_by("topics.id")
+                .get()
             )
 
-            # Collect co-occurring topics
-            topic_id_set = set(topic_ids)
-            for work in works:
-                for topic in work.get("topics", []):
-                    tid = topic.get("id")
-                    if tid and tid not in topic_id_set:
-                        score = topic.get("score", 1.0)
-                        related[tid] += score
+            # Groups come back sorted by count; skip the input topics
+            exclude = {tid.rpartition("/")[2] for tid in topic_ids}
+            related = []
+            for group in groups:
+                tid = group.get("key")
+                if tid and tid.rpartition("/")[2] not in exclude:
+                    related.append(tid)
+                    if len(related) >= limit:
+                        break
 
-            return [tid for tid, _ in related.most_common(limit)]
+            return related
 
         except Exception as e:
             logger.error(f"Error finding related topics: {e}")
+            self.client.record_failure()
             return []
 
     def _extract_id(self, openalex_url: Optional[str]) -> Optional[int]:
@@ -297,13 +339,7 @@ class TopicsService:
         """
         if not openalex_url:
             return None
-
-        try:
-            # Handle both full URL and short form
-            parts = openalex_url.rstrip("/").split("/")
-            return int(parts[-1])
-        except (ValueError, IndexError):
-            return None
+        return _parse_numeric_id(openalex_url)
 
 
 # Global service instance
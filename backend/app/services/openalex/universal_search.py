@@ -12,13 +12,17 @@ Pipeline:
 5. Merge with cross-discipline representation
 """
 
+import heapq
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from app.models.journal import Journal
 from .client import get_client
+from .config import get_max_concurrent_requests
 from .journals import convert_to_journal, categorize_journals
-from .scoring import EnhancedJournalScorer, ScoringContext
 
 logger = logging.getLogger(__name__)
 
@@ -27,14 +31,14 @@ logger = logging.getLogger(__name__)
 def _get_analysis_imports():
     """Lazy import analysis modules to break circular import."""
     from app.services.analysis import (
-        ArticleTypeDetector,
+        get_article_type_detector,
         get_smart_analyzer,
     )
     from app.services.analysis.dynamic_stats import (
         get_subfield_stats,
         calculate_percentile_score,
     )
-    return get_smart_analyzer, ArticleTypeDetector, get_subfield_stats, calculate_percentile_score
+    return get_smart_analyzer, get_article_type_detector, get_subfield_stats, calculate_percentile_score
 
 
 class UniversalSearchResult:
@@ -85,7 +89,7 @@ def search_journals_universal(
         UniversalSearchResult with journals and metadata
     """
     # Lazy imports to avoid circular dependency
-    get_smart_analyzer, ArticleTypeDetector, get_subfield_stats, calculate_percentile_score = _get_analysis_imports()
+    get_smart_analyzer, get_article_type_detector, _, _ = _get_analysis_imports()
 
     # 1. Use SmartAnalyzer for discipline detection (Phase 4)
     smart_analyzer = get_smart_analyzer(enable_llm=False)
@@ -95,8 +99,10 @@ def search_journals_universal(
         user_keywords=keywords,
     )
 
-    # Convert SmartAnalyzer disciplines to dict format
+    # Convert SmartAnalyzer disciplines to dict format, collecting the
+    # subfields to search (top 5 disciplines) in the same pass
     detected_disciplines = []
+    subfields = []
     for disc in analysis_result.disciplines:
         # Extract numeric ID from subfield_id string if possible
         numeric_id = None
@@ -106,16 +112,21 @@ def search_journals_universal(
             except (ValueError, AttributeError):
                 pass
 
+        openalex_subfield_id = disc.subfield_id if disc.subfield_id != "llm-detected" else None
         detected_disciplines.append({
             "name": disc.subfield_name,
             "confidence": disc.confidence,
             "field": disc.field_name,
             "domain": disc.domain_name,
             "numeric_id": numeric_id,
-            "openalex_subfield_id": disc.subfield_id if disc.subfield_id != "llm-detected" else None,
+            "openalex_subfield_id": openalex_subfield_id,
             "source": "smart_analyzer",
         })
 
+        subfield_id = numeric_id or openalex_subfield_id
+        if subfield_id and len(detected_disciplines) <= 5:
+            subfields.append((subfield_id, disc.subfield_name))
+
     if not detected_disciplines:
         logger.warning("No disciplines detected")
         return UniversalSearchResult(
@@ -123,36 +134,37 @@ def search_journals_universal(
             detected_disciplines=[],
         )
 
-    primary_domain = detected_disciplines[0].get("domain")
-    primary_field = detected_disciplines[0].get("field")
+    primary = detected_disciplines[0]
+    primary_domain = primary["domain"]
+    primary_field = primary["field"]
 
     logger.info(
         f"Universal detection: {len(detected_disciplines)} disciplines. "
-        f"Primary: {detected_disciplines[0].get('name')} ({primary_domain})"
+        f"Primary: {primary['name']} ({primary_domain})"
     )
 
     # 2. Detect article type (existing logic)
-    article_type_detector = ArticleTypeDetector()
+    article_type_detector = get_article_type_detector()
     detected_article_type = article_type_detector.detect(abstract, title)
     article_type_dict = article_type_detector.to_dict(detected_article_type)
 
     # 3. Search journals for each detected subfield
     all_journals: Dict[str, List[Journal]] = {}
 
-    for disc in detected_disciplines[:5]:  # Top 5 disciplines
-        subfield_id = disc.get("numeric_id") or disc.get("openalex_subfield_id")
-        subfield_name = disc.get("name", "")
-
-        if not subfield_id:
-            continue
+    # Subfield lookups are independent OpenAlex round trips - run them
+    # concurrently, then score in discipline order
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(len(subfields), get_max_concurrent_requests()))
+    ) as executor:
+        futures = [
+            executor.submit(_fetch_subfield_journals, subfield_id, subfield_name)
+            for subfield_id, subfield_name in subfields
+        ]
 
-        # Get journals in this subfield
-        journals = find_journals_by_subfield_id_universal(subfield_id)
+    for (subfield_id, subfield_name), future in zip(subfields, futures):
+        journals = future.result()
 
         if journals:
-            # Get dynamic stats for scoring
-            stats = get_subfield_stats(subfield_id, subfield_name)
-
             # Score journals relative to their subfield
             scored_journals = score_journals_universal(
                 journals=journals,
@@ -176,9 +188,10 @@ def search_journals_universal(
     # Categorize journals
     categorized = categorize_journals(merged)
 
-    # Normalize scores to 0-1 range
+    # Normalize scores to 0-1 range. The merge returns journals sorted by
+    # score (categorizing keeps the order), so the first one holds the max
     if categorized:
-        max_score = max(j.relevance_score for j in categorized)
+        max_score = categorized[0].relevance_score
         if max_score > 0:
             for journal in categorized:
                 journal.relevance_score = journal.relevance_score / max_score
@@ -187,12 +200,22 @@ def search_journals_universal(
         journals=categorized[:max_results],
         detected_disciplines=detected_disciplines,
         article_type=article_type_dict,
-        detection_method="universal_openalex_ml" if detected_disciplines[0].get("source") == "openalex_ml" else "keyword_fallback",
+        detection_method="universal_openalex_ml" if primary["source"] == "openalex_ml" else "keyword_fallback",
         primary_domain=primary_domain,
         primary_field=primary_field,
     )
 
 
+def _fetch_subfield_journals(subfield_id: int, subfield_name: str) -> List[Journal]:
+    """Get a subfield's journals and warm its dynamic stats for scoring."""
+    _, _, get_subfield_stats, _ = _get_analysis_imports()
+
+    journals = find_journals_by_subfield_id_universal(subfield_id)
+    if journals:
+        get_subfield_stats(subfield_id, subfield_name)
+    return journals
+
+
 def find_journals_by_subfield_id_universal(
     subfield_id: int,
     max_results: int = 30,
@@ -218,18 +241,24 @@ def find_journals_by_subfield_id_universal(
             per_page=max_results,
         )
 
-        journals = []
+        entries = []
         for entry in results[:max_results]:
             source_id = entry.get("key")
             count = entry.get("count", 0)
-
             if source_id and count > 0:
-                full_source = client.get_source_by_id(source_id)
-                if full_source:
-                    journal = convert_to_journal(full_source)
-                    if journal:
-                        journal.match_reason = f"Active in this subfield ({count} recent works)"
-                        journals.append(journal)
+                entries.append((source_id, count))
+
+        # One batched lookup for all sources instead of one request each
+        full_sources = client.get_sources_by_ids([source_id for source_id, _ in entries])
+
+        journals = []
+        for source_id, count in entries:
+            full_source = full_sources.get(source_id)
+            if full_source:
+                journal = convert_to_journal(full_source)
+                if journal:
+                    journal.match_reason = f"Active in this subfield ({count} recent works)"
+                    journals.append(journal)
 
         return journals
     except Exception as e:
@@ -265,34 +294,23 @@ def score_journals_universal(
     # Get dynamic stats for this subfield
     stats = get_subfield_stats(subfield_id, subfield_name)
 
-    # Create scoring context
-    scoring_context = ScoringContext(
-        detected_disciplines=detected_disciplines,
-        article_type=article_type,
-        keywords=[],
-        prefer_open_access=prefer_open_access,
+    # Field thresholds are the same for every journal in this subfield
+    h_thresholds = (stats.median_h_index, stats.p75_h_index, stats.p90_h_index)
+    citedness_thresholds = (
+        stats.median_citedness,
+        stats.p75_citedness,
+        stats.p90_citedness,
     )
 
-    scorer = EnhancedJournalScorer()
-
     for journal in journals:
         # Calculate normalized scores based on field statistics
         h_index = journal.metrics.h_index or 0
         citedness = journal.metrics.two_yr_mean_citedness or 0
 
         # Calculate percentile scores
-        h_percentile = calculate_percentile_score(
-            h_index,
-            stats.median_h_index,
-            stats.p75_h_index,
-            stats.p90_h_index,
-        )
-
+        h_percentile = calculate_percentile_score(h_index, *h_thresholds)
         citedness_percentile = calculate_percentile_score(
-            citedness,
-            stats.median_citedness,
-            stats.p75_citedness,
-            stats.p90_citedness,
+            citedness, *citedness_thresholds
         )
 
         # Combined score (citedness weighted more for research impact)
@@ -335,7 +353,7 @@ def merge_journal_results_universal(
         max_results: Maximum journals to return
 
     Returns:
-        Merged list of journals
+        Merged list of journals, sorted by relevance score (highest first)
     """
     merged = []
     seen_ids = set()
@@ -365,15 +383,26 @@ def merge_journal_results_universal(
                 added += 1
 
     # Fill remaining slots with best overall
-    all_journals = [j for js in discipline_results.values() for j in js]
-    all_journals.sort(key=lambda j: j.relevance_score, reverse=True)
-
-    for journal in all_journals:
-        if len(merged) >= max_results:
-            break
-        if journal.id not in seen_ids:
-            merged.append(journal)
-            seen_ids.add(journal.id)
+    remaining = max_results - len(merged)
+    if remaining > 0:
+        unseen = [
+            j
+            for j in chain.from_iterable(discipline_results.values())
+            if j.id not in seen_ids
+        ]
+        # The same journal can be listed under several disciplines - select
+        # enough extra candidates to cover repeat copies, without a full sort
+        repeats = len(unseen) - len({j.id for j in unseen})
+        top_unseen = heapq.nlargest(
+            remaining + repeats, unseen, key=attrgetter("relevance_score")
+        )
+
+        for journal in top_unseen:
+            if len(merged) >= max_results:
+                break
+            if journal.id not in seen_ids:
+                merged.append(journal)
+                seen_ids.add(journal.id)
 
     # Final sort by score
     merged.sort(key=lambda j: j.relevance_score, reverse=True)
@@ -7,12 +7,13 @@ Note: Discipline detection now uses OpenAlex's ML classification directly
 via get_topics_from_similar_works() in search.py.
 """
 import re
-from typing import List, Set, Tuple
+from functools import lru_cache
+from typing import FrozenSet, Iterator, List, Optional, Set, Tuple
 
 
 # Stopwords for search term extraction
 # Includes common English stopwords + generic academic terms
-STOPWORDS: Set[str] = {
+STOPWORDS: FrozenSet[str] = frozenset({
     "the",
     "a",
     "an",
@@ -192,15 +193,72 @@ STOPWORDS: Set[str] = {
     "investigate",
     "investigates",
     "investigated",
-}
-
-
-def extract_bigrams(words: List[str]) -> List[str]:
+})
+
+# Characters dropped from text before splitting into words
+_NON_WORD_RE = re.compile(r"[^\w\s-]")
+
+# Characters dropped from journal names (anything not alphanumeric or space)
+_NON_NAME_CHAR_RE = re.compile(r"[^\w\s]|_")
+
+
+# Important academic phrases to look for (known high-value phrases).
+# Checked with plain substring tests - for a few dozen fixed phrases that is
+# faster than one combined regex scan.
+IMPORTANT_PHRASES: Tuple[str, ...] = (
+    "child development",
+    "infant development",
+    "social emotional",
+    "social-emotional",
+    "emotion regulation",
+    "emotional regulation",
+    "machine learning",
+    "deep learning",
+    "neural network",
+    "artificial intelligence",
+    "natural language processing",
+    "clinical trial",
+    "randomized controlled",
+    "systematic review",
+    "meta analysis",
+    "meta-analysis",
+    "confirmatory factor",
+    "structural equation",
+    "factor analysis",
+    "psychometric properties",
+    "validation study",
+    "internal consistency",
+    "construct validity",
+    "content analysis",
+    "thematic analysis",
+    "grounded theory",
+    "qualitative research",
+    "quantitative research",
+    "mixed methods",
+    "cross sectional",
+    "longitudinal study",
+    "cohort study",
+    "case control",
+    "public health",
+    "health care",
+    "health policy",
+    "climate change",
+    "renewable energy",
+    "supply chain",
+    "decision making",
+    "risk assessment",
+    "data analysis",
+    "statistical analysis",
+)
+
+
+def extract_bigrams(words: List[str], limit: Optional[int] = None) -> List[str]:
     """
     Extract meaningful bigrams from word list.
 
     Args:
         words: List of cleaned words.
+        limit: Stop after this many bigrams (None for all).
 
     Returns:
         List of bigrams that appear meaningful.
@@ -209,8 +267,7 @@ def extract_bigrams(words: List[str]) -> List[str]:
         return []
 
     bigrams = []
-    for i in range(len(words) - 1):
-        w1, w2 = words[i], words[i + 1]
+    for w1, w2 in zip(words, words[1:]):
         # Skip if either is a stopword
         if w1 in STOPWORDS or w2 in STOPWORDS:
             continue
@@ -218,16 +275,19 @@ def extract_bigrams(words: List[str]) -> List[str]:
         if len(w1) < 3 or len(w2) < 3:
             continue
         bigrams.append(f"{w1} {w2}")
+        if limit is not None and len(bigrams) >= limit:
+            break
 
     return bigrams
 
 
-def extract_trigrams(words: List[str]) -> List[str]:
+def extract_trigrams(words: List[str], limit: Optional[int] = None) -> List[str]:
     """
     Extract meaningful trigrams from word list.
 
     Args:
         words: List of cleaned words.
+        limit: Stop after this many trigrams (None for all).
 
     Returns:
         List of trigrams that appear meaningful.
@@ -236,8 +296,7 @@ def extract_trigrams(words: List[str]) -> List[str]:
         return []
 
     trigrams = []
-    for i in range(len(words) - 2):
-        w1, w2, w3 = words[i], words[i + 1], words[i + 2]
+    for w1, w2, w3 in zip(words, words[1:], words[2:]):
         # Middle word can be a stopword (e.g., "machine for learning")
         # but first and last should be meaningful
         if w1 in STOPWORDS or w3 in STOPWORDS:
@@ -245,6 +304,8 @@ def extract_trigrams(words: List[str]) -> List[str]:
         if len(w1) < 3 or len(w3) < 3:
             continue
         trigrams.append(f"{w1} {w2} {w3}")
+        if limit is not None and len(trigrams) >= limit:
+            break
 
     return trigrams
 
@@ -280,103 +341,46 @@ def extract_search_terms(
             terms.append(kw_clean)
             terms_lower.add(kw_clean.lower())
 
-    text_lower = text.lower()
+    # Text candidates in priority order; one budget check covers every stage
+    if len(terms) < max_terms:
+        for term in _text_term_candidates(text.lower(), include_ngrams):
+            if term not in terms_lower:
+                terms.append(term)
+                terms_lower.add(term)
+                if len(terms) >= max_terms:
+                    break
+
+    return terms[:max_terms]
+
+
+def _text_term_candidates(text_lower: str, include_ngrams: bool) -> Iterator[str]:
+    """
+    Yield search term candidates from lowercased text, best first.
+
+    Known phrases come first, then auto-detected trigrams and bigrams, then
+    individual words. Lazy, so the text is only tokenized if the phrases do
+    not fill the caller's budget.
+    """
+    # Known important phrases found in text
+    for phrase in IMPORTANT_PHRASES:
+        if phrase in text_lower:
+            yield phrase
 
     # Clean text: remove special chars but keep spaces
-    clean_text = re.sub(r"[^\w\s-]", " ", text_lower)
+    clean_text = _NON_WORD_RE.sub(" ", text_lower)
     words = [w for w in clean_text.split() if len(w) > 2]
 
-    # Important academic phrases to look for (known high-value phrases)
-    important_phrases = [
-        "child development",
-        "infant development",
-        "social emotional",
-        "social-emotional",
-        "emotion regulation",
-        "emotional regulation",
-        "machine learning",
-        "deep learning",
-        "neural network",
-        "artificial intelligence",
-        "natural language processing",
-        "clinical trial",
-        "randomized controlled",
-        "systematic review",
-        "meta analysis",
-        "meta-analysis",
-        "confirmatory factor",
-        "structural equation",
-        "factor analysis",
-        "psychometric properties",
-        "validation study",
-        "internal consistency",
-        "construct validity",
-        "content analysis",
-        "thematic analysis",
-        "grounded theory",
-        "qualitative research",
-        "quantitative research",
-        "mixed methods",
-        "cross sectional",
-        "longitudinal study",
-        "cohort study",
-        "case control",
-        "public health",
-        "health care",
-        "health policy",
-        "climate change",
-        "renewable energy",
-        "supply chain",
-        "decision making",
-        "risk assessment",
-        "data analysis",
-        "statistical analysis",
-    ]
-
-    # Add known important phrases found in text
-    for phrase in important_phrases:
-        if phrase in text_lower and phrase.lower() not in terms_lower:
-            terms.append(phrase)
-            terms_lower.add(phrase.lower())
-            if len(terms) >= max_terms:
-                return terms
-
-    # Auto-detect bigrams and trigrams from text
+    # Auto-detected n-grams (only the first few are used), most promising
+    # trigrams first (longer = more specific)
     if include_ngrams:
-        # Get auto-detected n-grams
-        bigrams = extract_bigrams(words)
-        trigrams = extract_trigrams(words)
-
-        # Add most promising trigrams first (longer = more specific)
-        for trigram in trigrams[:3]:
-            if trigram not in terms_lower:
-                terms.append(trigram)
-                terms_lower.add(trigram.lower())
-                if len(terms) >= max_terms:
-                    return terms
+        yield from extract_trigrams(words, limit=3)
+        yield from extract_bigrams(words, limit=3)
 
-        # Then bigrams
-        for bigram in bigrams[:3]:
-            if bigram not in terms_lower:
-                terms.append(bigram)
-                terms_lower.add(bigram.lower())
-                if len(terms) >= max_terms:
-                    return terms
-
-    # Add individual important words
+    # Individual important words
     for word in words:
         clean = word.strip("-")
-        if (
-            len(clean) > 3
-            and clean not in STOPWORDS
-            and clean not in terms_lower
-        ):
-            terms.append(clean)
-            terms_lower.add(clean.lower())
-            if len(terms) >= max_terms:
-                break
-
-    return terms[:max_terms]
+        if len(clean) > 3 and clean not in STOPWORDS:
+            yield clean
 
 
 def extract_search_terms_enhanced(
@@ -400,13 +404,17 @@ def extract_search_terms_enhanced(
     # Combine user keywords with OpenAlex keywords
     all_keywords = list(keywords)
     if openalex_keywords:
+        seen = {k.lower() for k in all_keywords}
         for kw in openalex_keywords:
-            if kw.lower() not in {k.lower() for k in all_keywords}:
+            kw_lower = kw.lower()
+            if kw_lower not in seen:
                 all_keywords.append(kw)
+                seen.add(kw_lower)
 
     return extract_search_terms(text, all_keywords, max_terms)
 
 
+@lru_cache(maxsize=8192)
 def normalize_journal_name(name: str) -> str:
     """
     Normalize journal name for comparison.
@@ -417,5 +425,8 @@ def normalize_journal_name(name: str) -> str:
     Returns:
         Lowercase, alphanumeric only, single spaces.
     """
-    normalized = "".join(c.lower() for c in name if c.isalnum() or c.isspace())
+    kept = _NON_NAME_CHAR_RE.sub("", name)
+    # Lowercase per character: whole-string lower() is context-sensitive
+    # for some scripts (Greek final sigma), ASCII names take the fast path
+    normalized = kept.lower() if kept.isascii() else "".join(map(str.lower, kept))
     return " ".join(normalized.split())
@@ -22,6 +22,26 @@ def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def clear_openalex_caches():
+    """Keep OpenAlex response, stats and search result caches from leaking between tests."""
+    import app.services.analysis.dynamic_stats as stats_module
+    import app.services.openalex.client as client_module
+    from app.services.openalex.search import clear_text_search_cache
+
+    def clear():
+        # Only clear singletons that already exist - creating them needs live settings
+        if client_module._client is not None:
+            client_module._client.clear_cache()
+        if stats_module._stats_calculator is not None:
+            stats_module._stats_calculator.clear_cache()
+        clear_text_search_cache()
+
+    clear()
+    yield
+    clear()
+
+
 @pytest.fixture
 def mock_settings():
     """Mock application settings."""
@@ -6,6 +6,8 @@ for accurate journal scoring across any academic discipline.
 """
 
 import pytest
+from unittest.mock import patch
+
 from app.services.analysis.dynamic_stats import (
     DynamicStatsCalculator,
     get_subfield_stats,
@@ -183,3 +185,34 @@ class TestConvenienceFunction:
 
         assert isinstance(stats, SubfieldStats)
         assert stats.subfield_id == 2705
+
+
+class TestSubfieldJournalLookup:
+    """Test how subfield journals are fetched for statistics."""
+
+    @patch("app.services.analysis.dynamic_stats.get_client")
+    def test_source_details_fetched_in_batches(self, mock_get_client):
+        """Test details come from batched lookups and stop at 50 journals."""
+        client = mock_get_client.return_value
+        client.find_sources_by_subfield_id.return_value = [
+            {"key": f"https://openalex.org/S{i}", "count": 100 - i} for i in range(80)
+        ]
+
+        def get_sources_by_ids(ids):
+            # Odd-numbered sources in the first batch are missing
+            found = {}
+            for sid in ids:
+                number = int(sid.rsplit("S", 1)[1])
+                if number % 2 == 0 or number >= 50:
+                    found[sid] = {"id": sid}
+            return found
+
+        client.get_sources_by_ids.side_effect = get_sources_by_ids
+
+        journals = DynamicStatsCalculator()._get_journals_in_subfield(2705)
+
+        assert client.get_sources_by_ids.call_count == 2
+        assert len(journals) == 50
+        assert journals[0]["id"] == "https://openalex.org/S0"
+        assert journals[25]["id"] == "https://openalex.org/S50"
+        client.get_source_by_id.assert_not_called()
@@ -0,0 +1,144 @@
+"""
+Tests for journal relevance scoring.
+"""
+
+from app.models.journal import Journal, JournalMetrics
+from app.services.openalex.scoring import (
+    EnhancedJournalScorer,
+    ScoringContext,
+    calculate_relevance_score,
+    generate_match_details,
+    journal_text,
+    prepare_query,
+    score_and_explain,
+)
+
+
+def make_journal(**overrides) -> Journal:
+    """Build a journal with sensible defaults for scoring tests."""
+    data = {
+        "id": "https://openalex.org/S1",
+        "name": "Journal of Child Development",
+        "topics": ["Child Development and Parenting", "Infant Cognition"],
+        "metrics": JournalMetrics(h_index=120, two_yr_mean_citedness=4.0),
+        "is_oa": True,
+    }
+    data.update(overrides)
+    return Journal(**data)
+
+
+class TestScoreAndExplain:
+    """Tests for the fused score + match details pass."""
+
+    def test_score_matches_calculate_relevance_score(self):
+        """Fused score equals the standalone score wrapper."""
+        journal = make_journal()
+        terms = ["child development", "empathy"]
+
+        fused = score_and_explain(
+            journal, prepare_query("Child Development", terms), True, True
+        )
+        score = calculate_relevance_score(
+            journal, "Child Development", True, True, terms, set()
+        )
+
+        assert fused.score == score
+        # 20 topic + 10 keyword + 50 title + 6 h-index + 6 citation + 25 discipline name
+        assert score == 117.0
+
+    def test_details_match_generate_match_details(self):
+        """Fused details equal the standalone details wrapper."""
+        journal = make_journal()
+        terms = ["child development", "infant"]
+
+        fused = score_and_explain(
+            journal, prepare_query("Child Development", terms), False, True
+        )
+        details, matched = generate_match_details(
+            journal, "Child Development", False, True, terms
+        )
+
+        assert fused.details == details
+        assert fused.matched_topics == matched
+        assert "Specialized in Child Development" in details
+        assert matched == ["Child Development and Parenting", "Infant Cognition"]
+
+    def test_discipline_topic_boost_without_name_match(self):
+        """Discipline words found only in topics give the standard boost."""
+        journal = make_journal(name="Acta Paediatrica", metrics=JournalMetrics())
+
+        result = score_and_explain(journal, prepare_query("Child Health", []), False, False)
+
+        assert result.score == 15.0
+        assert result.matched_topics == ["Child Development and Parenting"]
+
+    def test_legacy_discipline_fallback_keywords(self):
+        """Legacy discipline keys fall back to static topic keywords."""
+        journal = make_journal(
+            name="Quantum Letters", topics=["Qubit Control"], metrics=JournalMetrics()
+        )
+
+        score = calculate_relevance_score(journal, "physics", False, False, [], set())
+
+        assert score == 15.0
+
+    def test_score_only_skips_details(self):
+        """explain=False returns the score without building details."""
+        journal = make_journal()
+
+        result = score_and_explain(
+            journal, prepare_query("", ["development"]), False, False, explain=False
+        )
+
+        assert result.details == []
+        assert result.matched_topics == []
+        assert result.score > 0
+
+    def test_precomputed_text_gives_same_result(self):
+        """A shared journal_text() gives the same result as building it inline."""
+        journal = make_journal(topics=["Infant Cognition", "PARENTING Styles"])
+        query = prepare_query("Child Development", ["parenting", "infant"])
+
+        text = journal_text(journal)
+        result = score_and_explain(journal, query, True, False, text=text)
+
+        assert text.topics_blob == "infant cognition\nparenting styles"
+        assert result == score_and_explain(journal, query, True, False)
+        assert result.matched_topics == ["PARENTING Styles", "Infant Cognition"]
+
+
+class TestEnhancedJournalScorer:
+    """Tests for batch scoring with EnhancedJournalScorer."""
+
+    def test_score_journals_matches_score_journal(self):
+        """Batch scores equal per-journal scores for the same context."""
+        scorer = EnhancedJournalScorer()
+        context = ScoringContext(
+            detected_disciplines=[
+                {"name": "Child Development", "evidence": ["infant"]},
+                {"name": "Pediatrics", "openalex_subfield_id": "infant cognition"},
+            ],
+            article_type={"type": "systematic_review"},
+            keywords=["infant", "parenting"],
+        )
+        journals = [
+            make_journal(id="https://openalex.org/S1"),
+            make_journal(
+                id="https://openalex.org/S2",
+                name="Quantum Review Letters",
+                topics=["Qubit Control"],
+            ),
+        ]
+
+        scores = scorer.score_journals(
+            journals,
+            context,
+            topic_match_ids={"https://openalex.org/S1"},
+            keyword_match_ids={"https://openalex.org/S2"},
+        )
+
+        assert scores == [
+            scorer.score_journal(journals[0], context, is_topic_match=True),
+            scorer.score_journal(journals[1], context, is_keyword_match=True),
+        ]
+        assert scores[0] > scores[1]
@@ -20,6 +20,12 @@ from app.services.openalex import (
     find_journals_by_topics,
     merge_journal_results,
 )
+from app.services.openalex.client import SOURCE_SELECT_FIELDS, OpenAlexClient
+from app.services.openalex.search import (
+    _select_secondary_disciplines,
+    find_journals_by_subfield,
+    find_journals_from_works,
+)
 from app.models.journal import Journal, JournalMetrics, JournalCategory
 
 
@@ -56,6 +62,23 @@ class TestUtilityFunctions:
 
         assert len(terms) <= 10
 
+    def test_normalize_journal_name(self):
+        """Test names are lowercased, stripped of punctuation and single-spaced."""
+        from app.services.openalex import normalize_journal_name
+
+        assert normalize_journal_name("  The Lancet:  Oncology (UK) ") == "the lancet oncology uk"
+        assert normalize_journal_name("Revue_Médicale Suisse") == "revuemédicale suisse"
+
+    def test_extract_search_terms_enhanced_dedupes_openalex_keywords(self):
+        """Test OpenAlex keywords are added once, ignoring case."""
+        from app.services.openalex import extract_search_terms_enhanced
+
+        terms = extract_search_terms_enhanced(
+            "", ["Machine Learning"], ["machine learning", "Genomics", "genomics"]
+        )
+
+        assert terms == ["Machine Learning", "Genomics"]
+
 
 class TestJournalOperations:
     """Tests for journal operations (convert, categorize)."""
@@ -187,6 +210,13 @@ class TestOpenAlexService:
 
         assert result == []
 
+    def test_global_instance_is_shared(self):
+        """Test the backward-compat global resolves to the lazy singleton."""
+        from app.services.openalex import get_openalex_service
+
+        assert isinstance(openalex_service, OpenAlexService)
+        assert openalex_service is get_openalex_service()
+
     @patch("app.services.openalex.client.pyalex")
     def test_search_journals_by_keywords_with_mock(self, mock_pyalex):
         """Test search with mocked OpenAlex API."""
@@ -204,7 +234,7 @@ class TestOpenAlexService:
 
         # Mock Works search chain
         mock_works = MagicMock()
-        mock_works.search.return_value.filter.return_value.get.return_value = [
+        mock_works.search.return_value.filter.return_value.select.return_value.get.return_value = [
             {
                 "primary_location": {
                     "source": {"id": "https://openalex.org/S12345", "type": "journal"},
@@ -214,9 +244,9 @@ class TestOpenAlexService:
         ]
         mock_pyalex.Works.return_value = mock_works
 
-        # Mock Sources to return full details
+        # Mock Sources to return full details (batched by id filter)
         mock_sources = MagicMock()
-        mock_sources.__getitem__.return_value = mock_source
+        mock_sources.filter.return_value.select.return_value.get.return_value = [mock_source]
         mock_pyalex.Sources.return_value = mock_sources
 
         result = self.service.search_journals_by_keywords(
@@ -226,11 +256,46 @@ class TestOpenAlexService:
         # Results depend on the mock setup
         assert isinstance(result, list)
 
+    @patch("app.services.openalex.client.pyalex")
+    def test_search_journals_by_keywords_batches_source_details(self, mock_pyalex):
+        """Test missing source details are fetched in one batched request."""
+        mock_works = MagicMock()
+        mock_works.search.return_value.filter.return_value.select.return_value.get.return_value = [
+            {
+                "primary_location": {
+                    "source": {"id": f"https://openalex.org/S{i}", "type": "journal"},
+                    "is_oa": False,
+                }
+            }
+            for i in range(3)
+        ]
+        mock_pyalex.Works.return_value = mock_works
+
+        mock_sources = MagicMock()
+        mock_sources.search.return_value.get.return_value = []
+        mock_sources.filter.return_value.select.return_value.get.return_value = [
+            {
+                "id": f"https://openalex.org/S{i}",
+                "display_name": f"Journal {i}",
+                "works_count": 10000,
+                "summary_stats": {"h_index": 50},
+            }
+            for i in range(3)
+        ]
+        mock_pyalex.Sources.return_value = mock_sources
+
+        result = self.service.search_journals_by_keywords(["machine learning"])
+
+        mock_sources.filter.assert_called_once_with(openalex_id="S0|S1|S2")
+        mock_sources.filter.return_value.select.assert_called_once_with(SOURCE_SELECT_FIELDS)
+        mock_sources.__getitem__.assert_not_called()
+        assert {j.id for j in result} == {f"https://openalex.org/S{i}" for i in range(3)}
+
     @patch("app.services.openalex.client.pyalex")
     def test_search_journals_by_keywords_api_error(self, mock_pyalex):
         """Test handling of API errors."""
         mock_works = MagicMock()
-        mock_works.search.return_value.filter.return_value.get.side_effect = Exception(
+        mock_works.search.return_value.filter.return_value.select.return_value.get.side_effect = Exception(
             "API Error"
         )
         mock_pyalex.Works.return_value = mock_works
@@ -255,6 +320,9 @@ class TestOpenAlexService:
         mock_works.search.return_value.filter.return_value.get.return_value = [
             {"primary_location": {"source": mock_source, "is_oa": False}}
         ]
+        mock_works.search.return_value.filter.return_value.select.return_value.get.return_value = (
+            mock_works.search.return_value.filter.return_value.get.return_value
+        )
         mock_pyalex.Works.return_value = mock_works
 
         journals, discipline, field, confidence, detected_disciplines, article_type, analysis_metadata = self.service.search_journals_by_text(
@@ -324,7 +392,7 @@ class TestTopicBasedSearch:
     def test_get_topic_ids_from_similar_works(self, mock_pyalex):
         """Test extraction of topic IDs from similar works."""
         mock_works = MagicMock()
-        mock_works.search.return_value.filter.return_value.get.return_value = [
+        mock_works.search.return_value.filter.return_value.select.return_value.get.return_value = [
             {
                 "topics": [
                     {"id": "https://openalex.org/T12345", "score": 0.9},
@@ -349,7 +417,7 @@ class TestTopicBasedSearch:
     def test_get_topic_ids_handles_empty_topics(self, mock_pyalex):
         """Test handling of works without topics."""
         mock_works = MagicMock()
-        mock_works.search.return_value.filter.return_value.get.return_value = [
+        mock_works.search.return_value.filter.return_value.select.return_value.get.return_value = [
             {"topics": []},
             {"topics": None},
             {},
@@ -364,7 +432,7 @@ class TestTopicBasedSearch:
     def test_get_topic_ids_handles_api_error(self, mock_pyalex):
         """Test graceful handling of API errors."""
         mock_works = MagicMock()
-        mock_works.search.return_value.filter.return_value.get.side_effect = Exception(
+        mock_works.search.return_value.filter.return_value.select.return_value.get.side_effect = Exception(
             "API Error"
         )
         mock_pyalex.Works.return_value = mock_works
@@ -441,9 +509,9 @@ class TestTopicBasedSearch:
             "https://openalex.org/S22222": {"count": 100, "reason": "Topic match"},
         }
 
-        # Mock Sources to return None (can't fetch details)
+        # Mock Sources to return nothing (can't fetch details)
         mock_sources = MagicMock()
-        mock_sources.__getitem__.return_value = None
+        mock_sources.filter.return_value.select.return_value.get.return_value = []
         mock_pyalex.Sources.return_value = mock_sources
 
         result = merge_journal_results(keyword_journals, topic_journals)
@@ -451,6 +519,7 @@ class TestTopicBasedSearch:
         # Should only have keyword journal since topic journal couldn't be fetched
         assert len(result) == 1
         assert result[0].id == "https://openalex.org/S11111"
+        mock_sources.filter.assert_called_once_with(openalex_id="S22222")
 
     @patch("app.services.openalex.client.pyalex")
     def test_hybrid_search_integration(self, mock_pyalex):
@@ -474,6 +543,9 @@ class TestTopicBasedSearch:
                 "topics": [{"id": "https://openalex.org/T123", "score": 0.9}],
             }
         ]
+        mock_works.search.return_value.filter.return_value.select.return_value.get.return_value = (
+            mock_works.search.return_value.filter.return_value.get.return_value
+        )
         mock_works.filter.return_value.group_by.return_value.get.return_value = [
             {"key": "https://openalex.org/S12345", "count": 50},
         ]
@@ -481,6 +553,8 @@ class TestTopicBasedSearch:
 
         mock_sources = MagicMock()
         mock_sources.__getitem__.return_value = mock_source
+        mock_sources.filter.return_value.get.return_value = [mock_source]
+        mock_sources.filter.return_value.select.return_value.get.return_value = [mock_source]
         mock_pyalex.Sources.return_value = mock_sources
 
         journals, discipline, field, confidence, detected_disciplines, article_type, analysis_metadata = self.service.search_journals_by_text(
@@ -493,3 +567,286 @@ class TestTopicBasedSearch:
         assert discipline or detected_disciplines
         # Analysis metadata should always be present (Phase 4)
         assert analysis_metadata is not None
+
+
+class TestClientCache:
+    """Tests for the OpenAlex client's response cache."""
+
+    @patch("app.services.openalex.client.pyalex")
+    def test_repeated_search_hits_api_once(self, mock_pyalex):
+        """Test identical queries are served from cache."""
+        mock_works = MagicMock()
+        mock_works.search.return_value.filter.return_value.get.return_value = [{"id": "W1"}]
+        mock_pyalex.Works.return_value = mock_works
+        client = OpenAlexClient()
+
+        first = client.search_works("machine learning", per_page=50)
+        second = client.search_works("machine learning", per_page=50)
+        client.search_works("machine learning", per_page=200)
+
+        assert first == second == [{"id": "W1"}]
+        assert mock_pyalex.Works.call_count == 2
+
+    @patch("app.services.openalex.client.pyalex")
+    def test_errors_are_not_cached(self, mock_pyalex):
+        """Test failed requests are retried on the next call."""
+        mock_sources = MagicMock()
+        mock_sources.search.return_value.get.side_effect = [Exception("API Error"), [{"id": "S1"}]]
+        mock_pyalex.Sources.return_value = mock_sources
+        client = OpenAlexClient()
+
+        assert client.search_sources("cardiology") == []
+        assert client.failure_count == 1
+        assert client.search_sources("cardiology") == [{"id": "S1"}]
+        assert client.failure_count == 1
+
+    @patch("app.services.openalex.client.pyalex")
+    def test_cache_disabled_and_clear(self, mock_pyalex):
+        """Test cache_enabled=False and clear_cache() force fresh requests."""
+        mock_sources = MagicMock()
+        mock_sources.__getitem__.return_value = {"id": "https://openalex.org/S1"}
+        mock_pyalex.Sources.return_value = mock_sources
+
+        uncached = OpenAlexClient(cache_enabled=False)
+        uncached.get_source_by_id("S1")
+        uncached.get_source_by_id("S1")
+        assert mock_sources.__getitem__.call_count == 2
+
+        client = OpenAlexClient()
+        client.get_source_by_id("https://openalex.org/S1")
+        client.get_source_by_id("S1")
+        assert mock_sources.__getitem__.call_count == 3
+        client.clear_cache()
+        client.get_source_by_id("S1")
+        assert mock_sources.__getitem__.call_count == 4
+
+    @patch("app.services.openalex.client.pyalex")
+    def test_batched_partial_records_not_served_as_full(self, mock_pyalex):
+        """Test get_source_by_id() still fetches the full record after a batched lookup."""
+        partial = {"id": "https://openalex.org/S1", "display_name": "Journal One"}
+        full = dict(partial, topics=[{"id": "T1"}])
+        mock_sources = MagicMock()
+        mock_sources.filter.return_value.select.return_value.get.return_value = [partial]
+        mock_sources.__getitem__.return_value = full
+        mock_pyalex.Sources.return_value = mock_sources
+        client = OpenAlexClient()
+
+        assert client.get_sources_by_ids(["S1"]) == {partial["id"]: partial}
+        assert client.get_source_by_id("S1") == full
+        assert client.get_sources_by_ids(["S1"]) == {partial["id"]: partial}
+        assert mock_sources.filter.return_value.select.return_value.get.call_count == 1
+
+    @patch("app.services.openalex.client.pyalex")
+    def test_subfield_sources_cached(self, mock_pyalex):
+        """Test repeated subfield top-journal lookups reuse the cached groups."""
+        grouped = mock_pyalex.Works.return_value.filter.return_value.group_by.return_value
+        grouped.get.return_value = [{"key": "https://openalex.org/S1", "count": 12}]
+        client = OpenAlexClient()
+
+        first = client.find_sources_by_subfield_id(2746)
+        second = client.find_sources_by_subfield_id(2746)
+        client.find_sources_by_subfield_id(2746, per_page=50)
+
+        assert first == second == [{"key": "https://openalex.org/S1", "count": 12}]
+        assert grouped.get.call_count == 2
+
+
+class TestFindJournalsFromWorks:
+    """Tests for the works-based journal search pagination."""
+
+    @staticmethod
+    def make_works(source_ids):
+        return [
+            {"primary_location": {"source": {"id": sid, "type": "journal"}, "is_oa": False}}
+            for sid in source_ids
+        ]
+
+    @patch("app.services.openalex.search.get_prefetch_works_page2", return_value=False)
+    @patch("app.services.openalex.search.get_client")
+    def test_skips_page2_when_top_journals_dominate(self, mock_get_client, _):
+        """Test page 2 is skipped for a wide but concentrated first page."""
+        # 10 journals with 11 works each, 90 journals with 1 work each
+        source_ids = [f"S{i}" for i in range(10) for _ in range(11)]
+        source_ids += [f"S{i}" for i in range(10, 100)]
+        mock_get_client.return_value.search_works.return_value = self.make_works(source_ids)
+
+        result = find_journals_from_works("machine learning")
+
+        assert mock_get_client.return_value.search_works.call_count == 1
+        assert len(result) == 100
+        assert result["S0"]["count"] == 11
+
+    @patch("app.services.openalex.search.get_prefetch_works_page2", return_value=False)
+    @patch("app.services.openalex.search.get_client")
+    def test_fetches_page2_for_long_tail(self, mock_get_client, _):
+        """Test page 2 is fetched when page 1 has no dominant journals."""
+        source_ids = [f"S{i}" for i in range(100) for _ in range(2)]
+        mock_get_client.return_value.search_works.return_value = self.make_works(source_ids)
+
+        result = find_journals_from_works("machine learning")
+
+        assert mock_get_client.return_value.search_works.call_count == 2
+        assert result["S0"]["count"] == 4
+
+    @patch("app.services.openalex.search.get_client")
+    def test_prefetched_page2_dropped_when_not_needed(self, mock_get_client):
+        """Test a prefetched page 2 is requested but ignored for a short page 1."""
+        mock_get_client.return_value.search_works.return_value = self.make_works(["S0"] * 5)
+
+        result = find_journals_from_works("machine learning")
+
+        pages = {
+            call.kwargs["page"]
+            for call in mock_get_client.return_value.search_works.call_args_list
+        }
+        assert pages <= {1, 2} and 1 in pages
+        assert result["S0"]["count"] == 5
+
+    @patch("app.services.openalex.search.get_client")
+    def test_prefetch_does_not_deadlock_on_busy_fallback_pool(self, mock_get_client):
+        """Test page-2 prefetch still completes when every fallback worker runs a works search."""
+        from app.services.openalex.search import _speculative_executor
+
+        source_ids = [f"S{i}" for i in range(100) for _ in range(2)]
+        mock_get_client.return_value.search_works.return_value = self.make_works(source_ids)
+
+        futures = [
+            _speculative_executor.submit(find_journals_from_works, "machine learning")
+            for _ in range(_speculative_executor._max_workers)
+        ]
+
+        for future in futures:
+            assert future.result(timeout=10)["S0"]["count"] == 4
+
+
+class TestFindJournalsBySubfield:
+    """Tests for the subfield name search."""
+
+    @patch("app.services.openalex.search.get_client")
+    def test_merges_per_query_searches_in_order(self, mock_get_client):
+        """Test each name query is searched and the first query to find a journal sets its reason."""
+        client = mock_get_client.return_value
+        results = {
+            "Developmental and Educational Psychology": [{"id": "S3"}],
+            "developmental": [{"id": "S1"}, {"id": "S3"}],
+            "educational": [],
+            "infancy": [{"id": "S2"}, {"id": "S1"}],
+        }
+        client.search_sources.side_effect = lambda query, per_page: results[query]
+
+        result = find_journals_by_subfield(
+            "Developmental and Educational Psychology", ["infancy", "memory"]
+        )
+
+        queries = [c.args[0] for c in client.search_sources.call_args_list]
+        assert sorted(queries) == sorted(results)
+        assert result["S3"]["reason"] == (
+            "Specialized journal for Developmental and Educational Psychology"
+        )
+        assert result["S1"]["reason"] == "Related to Developmental and Educational Psychology"
+        assert result["S2"]["reason"] == "Specialized journal matching 'infancy'"
+
+
+class TestTextSearchCache:
+    """Tests for the search_journals_by_text result cache."""
+
+    @patch("app.services.openalex.search._search_journals_by_text")
+    def test_repeated_search_served_from_cache(self, mock_search):
+        """Test the same inputs run the pipeline once and return independent copies."""
+        journal = Journal(id="https://openalex.org/S1", name="Cardiology Today")
+        mock_search.return_value = ([journal], "Cardiology", "Medicine", 0.9, [], None, None)
+
+        first = search_journals_by_text("Heart failure", "Abstract", ["ecg"])
+        first[0][0].match_details.append("mutated by caller")
+        second = search_journals_by_text("Heart failure", "Abstract", ["ecg"])
+
+        mock_search.assert_called_once()
+        assert second[1:] == first[1:]
+        assert second[0][0].match_details == []
+        assert second[0][0] is not first[0][0]
+
+    @patch("app.services.openalex.search._search_journals_by_text")
+    def test_different_inputs_miss_cache(self, mock_search):
+        """Test any change in inputs or options runs a fresh search."""
+        journal = Journal(id="https://openalex.org/S1", name="Cardiology Today")
+        mock_search.return_value = ([journal], "Cardiology", "Medicine", 0.9, [], None, None)
+
+        search_journals_by_text("Heart failure", "Abstract")
+        search_journals_by_text("Heart failure", "Abstract", ["ecg"])
+        search_journals_by_text("Heart failure", "Abstract", prefer_open_access=True)
+        search_journals_by_text("Heart failure", "Abstract", ["ecg,mri"])
+        search_journals_by_text("Heart failure", "Abstract", ["ecg", "mri"])
+
+        assert mock_search.call_count == 5
+
+    @patch("app.services.openalex.search._search_journals_by_text")
+    def test_empty_results_not_cached(self, mock_search):
+        """Test a search that found no journals is re-run next time."""
+        mock_search.return_value = ([], "general", "", 0.0, [], None, None)
+
+        search_journals_by_text("Heart failure", "Abstract")
+        search_journals_by_text("Heart failure", "Abstract")
+
+        assert mock_search.call_count == 2
+
+    @patch("app.services.openalex.search._search_journals_by_text")
+    def test_degraded_results_not_cached(self, mock_search):
+        """Test results from a run where an OpenAlex request failed are re-run next time."""
+        from app.services.openalex.client import get_client
+
+        journal = Journal(id="https://openalex.org/S1", name="Cardiology Today")
+
+        def degraded_search(*args):
+            get_client().record_failure()
+            return ([journal], "Cardiology", "Medicine", 0.9, [], None, None)
+
+        mock_search.side_effect = degraded_search
+
+        search_journals_by_text("Heart failure", "Abstract")
+        search_journals_by_text("Heart failure", "Abstract")
+
+        assert mock_search.call_count == 2
+
+
+class TestSelectSecondaryDisciplines:
+    """Tests for pruning redundant secondary subfield searches."""
+
+    def test_skips_repeats_and_weak_same_field_disciplines(self):
+        """Test repeats and low-confidence same-field secondaries are dropped."""
+        secondary = [
+            {"name": "Cardiology", "field": "Medicine", "confidence": 0.8},
+            {"name": "Endocrinology", "field": "Medicine", "confidence": 0.6},
+            {"name": "endocrinology", "field": "Medicine", "confidence": 0.5},
+            {"name": "Nephrology", "field": "Medicine", "confidence": 0.1},
+            {"name": "Biochemistry", "field": "Biology", "confidence": 0.1},
+        ]
+
+        selected = _select_secondary_disciplines(secondary, "Cardiology", "Medicine", None)
+
+        assert [d["name"] for d in selected] == ["Endocrinology", "Biochemistry"]
+
+    def test_skips_primary_numeric_id(self):
+        """Test a secondary with the primary's numeric ID is not searched again."""
+        secondary = [
+            {"name": "Cardiology (alt)", "numeric_id": 2705, "field": "Medicine", "confidence": 0.9},
+            {"name": "Oncology", "numeric_id": 2730, "field": "Medicine", "confidence": 0.9},
+        ]
+
+        selected = _select_secondary_disciplines(secondary, "Cardiology", "Medicine", 2705)
+
+        assert [d["name"] for d in selected] == ["Oncology"]
+
+
+class TestGetClient:
+    """Tests for the shared client singleton."""
+
+    def test_concurrent_first_calls_share_one_client(self):
+        """Test threads racing on first use all get the same client."""
+        from concurrent.futures import ThreadPoolExecutor
+        import app.services.openalex.client as client_module
+
+        with patch.object(client_module, "_client", None):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                clients = list(executor.map(lambda _: client_module.get_client(), range(32)))
+
+        assert len({id(c) for c in clients}) == 1
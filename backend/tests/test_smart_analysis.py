@@ -251,3 +251,90 @@ class TestLLMTriggerDetection:
 
         assert cross_trigger is not None
         assert cross_trigger.activated is True
+
+
+class TestTopicRelevanceValidator:
+    """Tests for topic validation with a prepared search context."""
+
+    def test_prepared_context_matches_per_call_validation(self):
+        """Test a shared prepare() result gives the same validation as building it per call."""
+        from app.services.analysis import TopicRelevanceValidator
+
+        validator = TopicRelevanceValidator()
+        disciplines = [{"name": "Urology", "evidence": ["bladder"]}]
+        keywords = ["incontinence"]
+        journal = {"topics": ["COVID-19 Outcomes", "Heart Failure", "Bladder Dysfunction"]}
+
+        prepared = validator.prepare(disciplines, keywords)
+        validation = validator.validate_journal_topics(journal, disciplines, keywords, prepared)
+
+        assert prepared.expected_keywords == {"bladder", "incontinence"}
+        assert "covid" in prepared.irrelevant_patterns
+        assert "pediatric" not in prepared.irrelevant_patterns
+        assert validation == validator.validate_journal_topics(journal, disciplines, keywords)
+        assert validation["relevant_topics"] == ["bladder dysfunction"]
+        assert validation["irrelevant_topics"] == ["covid-19 outcomes", "heart failure"]
+
+
+class TestFindRelatedTopics:
+    """Tests for related-topic lookup via server-side grouping."""
+
+    @patch("pyalex.Works")
+    def test_uses_group_by_and_skips_input_topics(self, mock_works_class):
+        """Test related topics come from group_by counts without the input topics."""
+        from app.services.openalex.topics import TopicsService
+
+        mock_works = mock_works_class.return_value
+        mock_works.filter.return_value.group_by.return_value.get.return_value = [
+            {"key": "https://openalex.org/T1", "count": 90},
+            {"key": "https://openalex.org/T7", "count": 40},
+            {"key": "https://openalex.org/T8", "count": 25},
+            {"key": "https://openalex.org/T9", "count": 10},
+        ]
+
+        related = TopicsService().find_related_topics(["T1"], limit=2)
+
+        mock_works.filter.return_value.group_by.assert_called_once_with("topics.id")
+        assert related == ["https://openalex.org/T7", "https://openalex.org/T8"]
+
+
+class TestTopicHierarchy:
+    """Tests for topic hierarchy lookups via the Topics endpoint."""
+
+    TOPIC = {
+        "id": "https://openalex.org/T10001",
+        "display_name": "Urinary Incontinence",
+        "subfield": {"id": "https://openalex.org/subfields/2748", "display_name": "Urology"},
+        "field": {"id": "https://openalex.org/fields/27", "display_name": "Medicine"},
+        "domain": {"id": "https://openalex.org/domains/4", "display_name": "Health Sciences"},
+    }
+
+    @patch("pyalex.Topics")
+    def test_single_lookup_uses_topic_record(self, mock_topics_class):
+        """Test a single hierarchy is read straight from the topic record."""
+        from app.services.openalex.topics import TopicsService
+
+        mock_topics_class.return_value.__getitem__.return_value = self.TOPIC
+
+        hierarchy = TopicsService().get_topic_hierarchy("T10001")
+
+        mock_topics_class.return_value.__getitem__.assert_called_once_with("T10001")
+        assert hierarchy.subfield_id == 2748
+        assert hierarchy.field_name == "Medicine"
+        assert hierarchy.topic_id == "https://openalex.org/T10001"
+
+    @patch("pyalex.Topics")
+    def test_batch_lookup_uses_one_or_filter(self, mock_topics_class):
+        """Test several hierarchies are fetched with a single OR filter."""
+        from app.services.openalex.topics import TopicsService
+
+        mock_topics = mock_topics_class.return_value
+        mock_topics.filter.return_value.get.return_value = [self.TOPIC]
+
+        hierarchies = TopicsService().get_topic_hierarchies(
+            ["https://openalex.org/T10001", "T20002"]
+        )
+
+        mock_topics.filter.assert_called_once_with(openalex_id="T10001|T20002")
+        assert list(hierarchies) == ["https://openalex.org/T10001"]
+        assert hierarchies["https://openalex.org/T10001"].domain_name == "Health Sciences"
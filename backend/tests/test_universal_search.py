@@ -5,11 +5,14 @@ Tests that the complete search pipeline works for various academic domains.
 """
 
 import pytest
+from unittest.mock import MagicMock, patch
+
 from app.services.openalex.universal_search import (
     search_journals_universal,
     UniversalSearchResult,
     find_journals_by_subfield_id_universal,
 )
+from app.models.journal import Journal
 
 
 class TestUniversalSearch:
@@ -138,6 +141,33 @@ class TestFindJournalsBySubfield:
 
         assert len(journals) > 0
 
+    @patch("app.services.openalex.universal_search.get_client")
+    def test_source_details_fetched_in_one_batch(self, mock_get_client):
+        """Test source details come from one batched lookup, in aggregation order."""
+        client = mock_get_client.return_value
+        client.find_sources_by_subfield_id.return_value = [
+            {"key": "https://openalex.org/S2", "count": 40},
+            {"key": "https://openalex.org/S1", "count": 25},
+            {"key": "https://openalex.org/S3", "count": 0},
+        ]
+        client.get_sources_by_ids.return_value = {
+            f"https://openalex.org/S{i}": {
+                "id": f"https://openalex.org/S{i}",
+                "display_name": f"Journal {i}",
+                "type": "journal",
+            }
+            for i in (1, 2)
+        }
+
+        journals = find_journals_by_subfield_id_universal(2705)
+
+        client.get_sources_by_ids.assert_called_once_with(
+            ["https://openalex.org/S2", "https://openalex.org/S1"]
+        )
+        client.get_source_by_id.assert_not_called()
+        assert [j.name for j in journals] == ["Journal 2", "Journal 1"]
+        assert journals[0].match_reason == "Active in this subfield (40 recent works)"
+
 
 class TestSearchResultQuality:
     """Test quality of search results."""
@@ -176,3 +206,40 @@ class TestSearchResultQuality:
 
         journal_ids = [j.id for j in result.journals]
         assert len(journal_ids) == len(set(journal_ids)), "Found duplicate journals"
+
+
+class TestSubfieldFanOut:
+    """Test the concurrent per-subfield journal lookups."""
+
+    @patch("app.services.openalex.universal_search.score_journals_universal")
+    @patch("app.services.openalex.universal_search.find_journals_by_subfield_id_universal")
+    @patch("app.services.openalex.universal_search._get_analysis_imports")
+    def test_every_subfield_searched_and_kept_in_order(
+        self, mock_imports, mock_find, mock_score
+    ):
+        """Test each discipline with an ID is searched and merged in detection order."""
+        analysis = MagicMock()
+        analysis.disciplines = [
+            MagicMock(subfield_id=f"https://openalex.org/subfields/{sid}", subfield_name=name,
+                      confidence=0.9, field_name="Medicine", domain_name="Health Sciences")
+            for sid, name in ((2705, "Cardiology"), (2724, "Internal Medicine"))
+        ]
+        smart_analyzer = MagicMock()
+        smart_analyzer.analyze.return_value = analysis
+        get_detector = MagicMock()
+        get_detector.return_value.to_dict.return_value = None
+        mock_imports.return_value = (
+            lambda enable_llm: smart_analyzer, get_detector, MagicMock(), MagicMock()
+        )
+        mock_find.side_effect = lambda sid: [
+            Journal(id=f"https://openalex.org/S{sid}", name=f"Journal {sid}", relevance_score=1.0)
+        ]
+        mock_score.side_effect = lambda journals, **kwargs: journals
+
+        result = search_journals_universal("Heart failure", "Abstract")
+
+        assert sorted(call.args[0] for call in mock_find.call_args_list) == [2705, 2724]
+        assert [call.kwargs["subfield_name"] for call in mock_score.call_args_list] == [
+            "Cardiology", "Internal Medicine",
+        ]
+        assert {j.name for j in result.journals} == {"Journal 2705", "Journal 2724"}